@@ -13,7 +13,11 @@ import constants
 from modules.database import JobDatabase
 from tabs.ai_tools_tab import render_ai_tools
 from tabs.analytics_tab import render_analytics_tab
-from tabs.job_browser_tab import get_resume_version_pdf, render_job_browser
+from tabs.job_browser_tab import (
+    SITE_EMOJI,
+    get_resume_version_pdf,
+    render_job_browser,
+)
 from tabs.scraping_tab import render_scraping_tab
 from tabs.user_files_tab import render_user_files_tab
 
@@ -44,6 +48,21 @@ def init_session_state() -> None:
         st.session_state.description_text_filter = ""
 
 
+def get_database() -> JobDatabase:
+    """Get the database handler for this session.
+
+    The handler is opened on the first run and kept in session state, so
+    reruns reuse its connection instead of reconnecting and re-running the
+    schema setup every time a widget changes.
+
+    Returns:
+        Database instance for this session.
+    """
+    if "db" not in st.session_state:
+        st.session_state.db = JobDatabase(constants.JOBS_DB)
+    return st.session_state.db
+
+
 def startup_check() -> bool:
     """Validate required configuration files and directories.
 
@@ -123,7 +142,7 @@ def main() -> None:
         st.stop()
 
     # Initialize database
-    db = JobDatabase(constants.JOBS_DB)
+    db = get_database()
 
     # Sidebar filters
     st.sidebar.title("🔍 Filters")
@@ -260,7 +279,7 @@ def main() -> None:
 
     with tab1:
         try:
-            render_job_browser(db, jobs, total_count)
+            render_job_browser(db, jobs, total_count, filters)
         except Exception as e:
             st.error(f"❌ Error in Job Browser tab: {e}")
             import traceback
@@ -365,13 +384,7 @@ def main() -> None:
         if site_stats:
             with st.sidebar.expander("Jobs by Site"):
                 for site, count in site_stats:
-                    site_emoji = {
-                        "indeed": "📄",
-                        "linkedin": "💼",
-                        "glassdoor": "🏢",
-                        "zip_recruiter": "📨",
-                        "other": "📝",
-                    }.get(site.lower() if site else "", "🌐")
+                    site_emoji = SITE_EMOJI.get(site.lower() if site else "", "🌐")
                     st.write(f"{site_emoji} {site or 'Unknown'}: {count}")
 
         # Resume folder info
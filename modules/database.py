@@ -2,12 +2,49 @@
 
 import logging
 import sqlite3
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from typing import Any
 
 from constants import JOBS_DB
 
 logger = logging.getLogger(__name__)
 
+# Page cache per connection, in KiB (negative values of PRAGMA cache_size)
+CACHE_SIZE_KIB = 20000
+
+# Skill list columns of the jobs table, by job_skills.kind
+SKILL_COLUMNS = {
+    "extracted": "extracted_skills",
+    "matched": "matched_skills",
+    "partial": "partial_skills",
+    "missing": "missing_skills",
+}
+
+# Largest IN (...) list bound in one statement, below SQLite's variable limit
+IN_CHUNK_SIZE = 512
+
+
+def _id_chunks(ids: Iterable[int]) -> Iterator[list[int]]:
+    """Split IDs into chunks for IN (...) clauses.
+
+    Each chunk is padded with its last ID up to a power of two, so only a
+    handful of distinct statements are ever prepared and sqlite3's
+    statement cache can reuse them. Duplicate IDs don't change the result.
+    Any iterable works (e.g. the selection set), so callers needn't copy it
+    into a list first.
+
+    Args:
+        ids: IDs to split.
+
+    Yields:
+        Chunks of at most IN_CHUNK_SIZE IDs.
+    """
+    ids = iter(ids)
+    while chunk := list(islice(ids, IN_CHUNK_SIZE)):
+        size = 1 << (len(chunk) - 1).bit_length()
+        yield chunk + chunk[-1:] * (size - len(chunk))
+
 
 class JobDatabase:
     """Database handler for job applications."""
@@ -20,8 +57,17 @@ class JobDatabase:
         """
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._configure_connection()
         self._create_tables()
 
+    def _configure_connection(self) -> None:
+        """Enable WAL mode so readers don't block on writes (or vice versa)."""
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        # Safe with WAL; only the last commits can be lost on power failure
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+
     def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
         cursor = self.conn.cursor()
@@ -135,6 +181,112 @@ class JobDatabase:
             ON jobs(archived)
         """)
 
+        # Indexes for the analytics group-bys (site, company, score, day) and
+        # the job_id lookups bulk deletes do on the child tables
+        analytics_indexes = {
+            "idx_site": "ON jobs(site)",
+            "idx_company": "ON jobs(company) WHERE company IS NOT NULL",
+            "idx_llm_score": "ON jobs(llm_score) WHERE llm_score IS NOT NULL",
+            "idx_date_scraped_day": "ON jobs(DATE(date_scraped))",
+            "idx_applications_job": "ON applications(job_id)",
+            "idx_interview_stages_job": "ON interview_stages(job_id)",
+        }
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        existing_indexes = {row[0] for row in cursor.fetchall()}
+        for name, definition in analytics_indexes.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} {definition}")
+
+        # Refresh planner statistics so the new indexes get used
+        if not existing_indexes.issuperset(analytics_indexes):
+            cursor.execute("ANALYZE")
+
+        self.conn.commit()
+
+        self._create_skills_table()
+
+    def _create_skills_table(self) -> None:
+        """Create the job_skills table, kept in sync with jobs by triggers.
+
+        job_skills holds one row per skill in each job's JSON skill lists,
+        so skill statistics are plain indexed queries instead of json_each
+        over every job.
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'job_skills'"
+        )
+        exists = cursor.fetchone() is not None
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS job_skills (
+                job_id INTEGER NOT NULL,
+                skill TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                FOREIGN KEY (job_id) REFERENCES jobs(id)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_job_skills_kind_skill
+            ON job_skills(kind, skill)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_job_skills_job
+            ON job_skills(job_id)
+        """)
+
+        def insert_skills(row: str) -> str:
+            # Malformed or empty skill lists are treated as no skills
+            return "\n".join(
+                f"""
+                INSERT INTO job_skills (job_id, skill, kind)
+                SELECT {row}.id, value, '{kind}'
+                FROM json_each(
+                    CASE WHEN json_valid({row}.{column}) THEN {row}.{column} ELSE '[]' END
+                )
+                WHERE value IS NOT NULL;"""
+                for kind, column in SKILL_COLUMNS.items()
+            )
+
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_job_skills_insert
+            AFTER INSERT ON jobs
+            BEGIN
+                {insert_skills("NEW")}
+            END
+        """)
+
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_job_skills_update
+            AFTER UPDATE OF {", ".join(SKILL_COLUMNS.values())} ON jobs
+            BEGIN
+                DELETE FROM job_skills WHERE job_id = OLD.id;
+                {insert_skills("NEW")}
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_job_skills_delete
+            AFTER DELETE ON jobs
+            BEGIN
+                DELETE FROM job_skills WHERE job_id = OLD.id;
+            END
+        """)
+
+        # Backfill existing jobs when the table is first created
+        if not exists:
+            for kind, column in SKILL_COLUMNS.items():
+                cursor.execute(f"""
+                    INSERT INTO job_skills (job_id, skill, kind)
+                    SELECT jobs.id, json_each.value, '{kind}'
+                    FROM jobs, json_each(
+                        CASE WHEN json_valid(jobs.{column}) THEN jobs.{column} ELSE '[]' END
+                    )
+                    WHERE json_each.value IS NOT NULL
+                """)
+
         self.conn.commit()
 
     def insert_job(self, job_data: dict[str, Any]) -> int:
@@ -248,34 +400,33 @@ class JobDatabase:
             application_date: Optional application date (YYYY-MM-DD format).
                              If None, uses current timestamp.
         """
-        cursor = self.conn.cursor()
-
-        if application_date:
-            cursor.execute(
-                """
-                INSERT INTO applications (job_id, resume_version, resume_file_path, 
-                                        cover_letter_path, notes, application_date)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    job_id,
-                    resume_version,
-                    resume_path,
-                    cover_letter_path,
-                    notes,
-                    application_date,
-                ),
-            )
-        else:
-            cursor.execute(
-                """
-                INSERT INTO applications (job_id, resume_version, resume_file_path, 
-                                        cover_letter_path, notes)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (job_id, resume_version, resume_path, cover_letter_path, notes),
-            )
-        self.conn.commit()
+        # Commits on success, rolls back on error
+        with self.conn:
+            if application_date:
+                self.conn.execute(
+                    """
+                    INSERT INTO applications (job_id, resume_version, resume_file_path, 
+                                            cover_letter_path, notes, application_date)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        job_id,
+                        resume_version,
+                        resume_path,
+                        cover_letter_path,
+                        notes,
+                        application_date,
+                    ),
+                )
+            else:
+                self.conn.execute(
+                    """
+                    INSERT INTO applications (job_id, resume_version, resume_file_path, 
+                                            cover_letter_path, notes)
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    (job_id, resume_version, resume_path, cover_letter_path, notes),
+                )
 
     def add_interview_stage(
         self,
@@ -293,25 +444,93 @@ class JobDatabase:
             stage_date: Optional stage date (YYYY-MM-DD format).
                        If None, uses current timestamp.
         """
-        cursor = self.conn.cursor()
+        # Commits on success, rolls back on error
+        with self.conn:
+            if stage_date:
+                self.conn.execute(
+                    """
+                    INSERT INTO interview_stages (job_id, stage, notes, stage_date)
+                    VALUES (?, ?, ?, ?)
+                """,
+                    (job_id, stage, notes, stage_date),
+                )
+            else:
+                self.conn.execute(
+                    """
+                    INSERT INTO interview_stages (job_id, stage, notes)
+                    VALUES (?, ?, ?)
+                """,
+                    (job_id, stage, notes),
+                )
 
-        if stage_date:
-            cursor.execute(
-                """
-                INSERT INTO interview_stages (job_id, stage, notes, stage_date)
-                VALUES (?, ?, ?, ?)
-            """,
-                (job_id, stage, notes, stage_date),
-            )
-        else:
-            cursor.execute(
-                """
-                INSERT INTO interview_stages (job_id, stage, notes)
-                VALUES (?, ?, ?)
-            """,
-                (job_id, stage, notes),
-            )
-        self.conn.commit()
+    def _build_filter_clause(
+        self, filters: dict[str, Any] | None
+    ) -> tuple[str, list[Any]]:
+        """Build the WHERE conditions for the job browser filters.
+
+        The conditions refer to jobs as "j" and applications as "a".
+
+        Args:
+            filters: Dictionary of filter criteria.
+
+        Returns:
+            Tuple of (" AND ..." conditions, query parameters).
+        """
+        clause = ""
+        params: list[Any] = []
+
+        if not filters:
+            return clause, params
+
+        # Score filters
+        if filters.get("min_score") is not None:
+            clause += " AND j.llm_score >= ?"
+            params.append(filters["min_score"])
+        if filters.get("max_score") is not None:
+            clause += " AND j.llm_score <= ?"
+            params.append(filters["max_score"])
+
+        # Site filter
+        if filters.get("sites"):
+            placeholders = ",".join(["?" for _ in filters["sites"]])
+            clause += f" AND j.site IN ({placeholders})"
+            params.extend(filters["sites"])
+
+        # Text filters
+        if filters.get("company"):
+            clause += " AND j.company LIKE ?"
+            params.append(f"%{filters['company']}%")
+        if filters.get("location"):
+            clause += " AND j.location LIKE ?"
+            params.append(f"%{filters['location']}%")
+        if filters.get("title_text"):
+            clause += " AND j.title LIKE ?"
+            params.append(f"%{filters['title_text']}%")
+        if filters.get("description_text"):
+            clause += " AND j.description LIKE ?"
+            params.append(f"%{filters['description_text']}%")
+
+        # Application status
+        if filters.get("applied"):
+            clause += " AND a.id IS NOT NULL"
+        if filters.get("not_applied"):
+            clause += " AND a.id IS NULL"
+
+        # Date filters
+        if filters.get("date_from"):
+            clause += " AND j.date_scraped >= ?"
+            params.append(filters["date_from"])
+        if filters.get("date_to"):
+            clause += " AND j.date_scraped <= ?"
+            params.append(filters["date_to"] + " 23:59:59")
+
+        # Archive filter
+        if filters.get("show_archived") == "active":
+            clause += " AND j.archived = 0"
+        elif filters.get("show_archived") == "archived":
+            clause += " AND j.archived = 1"
+
+        return clause, params
 
     def get_all_jobs(
         self,
@@ -343,55 +562,9 @@ class JobDatabase:
             LEFT JOIN interview_stages i ON j.id = i.job_id
             WHERE 1=1
         """
-        params: list[Any] = []
-
-        if filters:
-            # Score filters
-            if filters.get("min_score") is not None:
-                query += " AND j.llm_score >= ?"
-                params.append(filters["min_score"])
-            if filters.get("max_score") is not None:
-                query += " AND j.llm_score <= ?"
-                params.append(filters["max_score"])
-
-            # Site filter
-            if filters.get("sites"):
-                placeholders = ",".join(["?" for _ in filters["sites"]])
-                query += f" AND j.site IN ({placeholders})"
-                params.extend(filters["sites"])
-
-            # Text filters
-            if filters.get("company"):
-                query += " AND j.company LIKE ?"
-                params.append(f"%{filters['company']}%")
-            if filters.get("location"):
-                query += " AND j.location LIKE ?"
-                params.append(f"%{filters['location']}%")
-            if filters.get("title_text"):
-                query += " AND j.title LIKE ?"
-                params.append(f"%{filters['title_text']}%")
-            if filters.get("description_text"):
-                query += " AND j.description LIKE ?"
-                params.append(f"%{filters['description_text']}%")
-
-            # Application status
-            if filters.get("applied"):
-                query += " AND a.id IS NOT NULL"
-            if filters.get("not_applied"):
-                query += " AND a.id IS NULL"
-
-            # Date filters
-            if filters.get("date_from"):
-                query += " AND j.date_scraped >= ?"
-                params.append(filters["date_from"])
-            if filters.get("date_to"):
-                query += " AND j.date_scraped <= ?"
-                params.append(filters["date_to"] + " 23:59:59")
-
-            if filters.get("show_archived") == "active":
-                query += " AND j.archived = 0"
-            elif filters.get("show_archived") == "archived":
-                query += " AND j.archived = 1"
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        query += filter_clause
+        params = list(filter_params)
 
         query += " GROUP BY j.id"
 
@@ -428,62 +601,35 @@ class JobDatabase:
             LEFT JOIN interview_stages i ON j.id = i.job_id
             WHERE 1=1
         """
-        count_params: list[Any] = []
-
-        if filters:
-            # Score filters
-            if filters.get("min_score") is not None:
-                count_query += " AND j.llm_score >= ?"
-                count_params.append(filters["min_score"])
-            if filters.get("max_score") is not None:
-                count_query += " AND j.llm_score <= ?"
-                count_params.append(filters["max_score"])
-
-            # Site filter
-            if filters.get("sites"):
-                placeholders = ",".join(["?" for _ in filters["sites"]])
-                count_query += f" AND j.site IN ({placeholders})"
-                count_params.extend(filters["sites"])
-
-            # Text filters
-            if filters.get("company"):
-                count_query += " AND j.company LIKE ?"
-                count_params.append(f"%{filters['company']}%")
-            if filters.get("location"):
-                count_query += " AND j.location LIKE ?"
-                count_params.append(f"%{filters['location']}%")
-            if filters.get("title_text"):
-                count_query += " AND j.title LIKE ?"
-                count_params.append(f"%{filters['title_text']}%")
-            if filters.get("description_text"):
-                count_query += " AND j.description LIKE ?"
-                count_params.append(f"%{filters['description_text']}%")
-
-            # Application status
-            if filters.get("applied"):
-                count_query += " AND a.id IS NOT NULL"
-            if filters.get("not_applied"):
-                count_query += " AND a.id IS NULL"
-
-            # Date filters
-            if filters.get("date_from"):
-                count_query += " AND j.date_scraped >= ?"
-                count_params.append(filters["date_from"])
-            if filters.get("date_to"):
-                count_query += " AND j.date_scraped <= ?"
-                count_params.append(filters["date_to"] + " 23:59:59")
-
-            # Archive filter
-            if filters.get("show_archived") == "active":
-                count_query += " AND j.archived = 0"
-            elif filters.get("show_archived") == "archived":
-                count_query += " AND j.archived = 1"
-
-        cursor.execute(count_query, count_params)
+        count_query += filter_clause
+
+        cursor.execute(count_query, filter_params)
         total_count = cursor.fetchone()[0]
 
         return jobs, total_count
 
+    def get_filtered_ids(self, filters: dict[str, Any] | None = None) -> list[int]:
+        """Get the IDs of every job matching the filters, across all pages.
+
+        Args:
+            filters: Dictionary of filter criteria, as for get_all_jobs.
+
+        Returns:
+            List of job IDs.
+        """
+        filter_clause, filter_params = self._build_filter_clause(filters)
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT DISTINCT j.id
+            FROM jobs j
+            LEFT JOIN applications a ON j.id = a.job_id
+            WHERE 1=1{filter_clause}
+        """,
+            filter_params,
+        )
+        return [row[0] for row in cursor.fetchall()]
+
     def archive_job(self, job_id: int) -> None:
         """Archive a job.
 
@@ -504,6 +650,54 @@ class JobDatabase:
         cursor.execute("UPDATE jobs SET archived = 0 WHERE id = ?", (job_id,))
         self.conn.commit()
 
+    def archive_jobs(self, job_ids: Iterable[int]) -> int:
+        """Archive several jobs in a single transaction.
+
+        Args:
+            job_ids: IDs of the jobs to archive.
+
+        Returns:
+            Number of jobs archived.
+        """
+        archived = 0
+        with self.conn:
+            for chunk in _id_chunks(job_ids):
+                placeholders = ",".join("?" * len(chunk))
+                archived += self.conn.execute(
+                    f"UPDATE jobs SET archived = 1 WHERE id IN ({placeholders})", chunk
+                ).rowcount
+        return archived
+
+    def delete_jobs(self, job_ids: Iterable[int]) -> tuple[int, int, int]:
+        """Delete jobs with their applications and interview stages.
+
+        Everything is removed in a single transaction, so a bulk delete
+        costs one commit regardless of how many jobs are selected. Children
+        go first, each through its job_id index.
+
+        Args:
+            job_ids: IDs of the jobs to delete.
+
+        Returns:
+            Tuple of (deleted jobs, deleted applications, deleted stages).
+        """
+        deleted_jobs = deleted_apps = deleted_stages = 0
+        with self.conn:
+            for chunk in _id_chunks(job_ids):
+                placeholders = ",".join("?" * len(chunk))
+                deleted_stages += self.conn.execute(
+                    f"DELETE FROM interview_stages WHERE job_id IN ({placeholders})",
+                    chunk,
+                ).rowcount
+                deleted_apps += self.conn.execute(
+                    f"DELETE FROM applications WHERE job_id IN ({placeholders})", chunk
+                ).rowcount
+                deleted_jobs += self.conn.execute(
+                    f"DELETE FROM jobs WHERE id IN ({placeholders})", chunk
+                ).rowcount
+
+        return deleted_jobs, deleted_apps, deleted_stages
+
     def get_read_only_conn(self) -> sqlite3.Connection:
         """Get a read-only SQLite connection.
 
@@ -511,9 +705,11 @@ class JobDatabase:
             Read-only SQLite connection.
         """
         # URI=True allows the ?mode=ro parameter
-        return sqlite3.connect(
+        conn = sqlite3.connect(
             f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
         )
+        conn.execute(f"PRAGMA cache_size=-{CACHE_SIZE_KIB}")
+        return conn
 
     def get_job_by_id(self, job_id: int) -> dict[str, Any] | None:
         """Get a single job by ID.
@@ -569,6 +765,44 @@ class JobDatabase:
         columns = [desc[0] for desc in cursor.description]
         return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
+    def get_job_edit_data(
+        self, job_id: int
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None, list[dict[str, Any]]]:
+        """Get a job with its application and interview stages.
+
+        Same as calling get_job_by_id, get_application_by_job_id and
+        get_interview_stages_by_job_id, but on one cursor, and the child
+        tables aren't queried when the job doesn't exist.
+
+        Args:
+            job_id: ID of the job.
+
+        Returns:
+            Tuple of (job or None, application or None, interview stages).
+        """
+        cursor = self.conn.cursor()
+
+        cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None, None, []
+        job = dict(zip([desc[0] for desc in cursor.description], row))
+
+        cursor.execute("SELECT * FROM applications WHERE job_id = ?", (job_id,))
+        row = cursor.fetchone()
+        application = (
+            dict(zip([desc[0] for desc in cursor.description], row)) if row else None
+        )
+
+        cursor.execute(
+            "SELECT * FROM interview_stages WHERE job_id = ? ORDER BY stage_date",
+            (job_id,),
+        )
+        columns = [desc[0] for desc in cursor.description]
+        stages = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        return job, application, stages
+
     def update_job(self, job_id: int, updates: dict[str, Any]) -> None:
         """Update editable job fields.
 
@@ -59,6 +59,11 @@ def load_interview_stages() -> Dict[str, Any]:
 # Load stages once when module is imported
 _INTERVIEW_STAGES_DATA = load_interview_stages()
 _INTERVIEW_STAGES = _INTERVIEW_STAGES_DATA.get("stages", [])
+# Label per stage ID; reversed so the first stage with an ID wins
+_STAGE_LABELS = {
+    stage["id"]: stage.get("label", stage["id"])
+    for stage in reversed(_INTERVIEW_STAGES)
+}
 
 
 def get_interview_stages() -> List[Dict[str, Any]]:
@@ -77,7 +82,7 @@ def get_stage_options() -> List[str]:
     Returns:
         List of stage IDs (including empty string for "Select stage...").
     """
-    return [""] + [stage["id"] for stage in get_interview_stages()]
+    return list(_STAGE_OPTIONS)
 
 
 def format_stage_option(stage_id: str) -> str:
@@ -92,13 +97,9 @@ def format_stage_option(stage_id: str) -> str:
     if not stage_id:
         return "Select stage..."
 
-    # Find the stage by ID
-    for stage in _INTERVIEW_STAGES:
-        if stage.get("id") == stage_id:
-            return stage.get("label", stage_id)
-
-    return stage_id
+    return _STAGE_LABELS.get(stage_id, stage_id)
 
 
 # Export for backward compatibility
 INTERVIEW_STAGES = get_interview_stages()
+_STAGE_OPTIONS = [""] + [stage["id"] for stage in INTERVIEW_STAGES]
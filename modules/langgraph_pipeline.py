@@ -7,6 +7,9 @@ import json
 from typing import TypedDict, List, Optional, Dict, Any
 import time
 import asyncio
+import copy
+import hashlib
+import os
 from itertools import islice
 import re
 
@@ -18,7 +21,7 @@ from langgraph.graph import StateGraph, END
 from modules.llm_config import get_config_manager
 from modules.prompts_loader import get_prompt
 from modules.database import JobDatabase
-from constants import JOBS_DB, CANDIDATE_SKILLS_FILE, RESUME_FILE
+from constants import JOBS_DB, CANDIDATE_SKILLS_FILE, RESUME_FILE, PROMPTS_FILE
 
 logger = logging.getLogger(__name__)
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -907,6 +910,55 @@ async def process_single_job_async(
         return {"job_data": job_data, "error": str(e), "status": "error"}
 
 
+# Results of recent single-job runs, keyed by content hash. Streamlit reruns
+# can re-enter the submit branch, so this keeps a repeated submission of the
+# same job from paying for the LLM stages twice.
+_SINGLE_JOB_CACHE: Dict[str, tuple[float, Dict[str, Any]]] = {}
+SINGLE_JOB_CACHE_TTL = 300  # seconds
+SINGLE_JOB_CACHE_SIZE = 32
+# Only outcomes that saved nothing are reused. An accepted job is written by
+# the save_job node, and a duplicate depends on what is in the database, so
+# both must run the pipeline again to stay correct.
+SINGLE_JOB_CACHEABLE_STATUSES = frozenset({"rejected", "low_score"})
+
+
+def _file_mtime(path: str) -> float:
+    """Return a file's mtime, or 0.0 if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+def single_job_cache_key(
+    job_data: Dict[str, Any], min_score: int, heuristic_threshold: float
+) -> str:
+    """Hash everything that can change the pipeline outcome for a job.
+
+    Covers every field of the job, the models configured for each stage and the
+    mtimes of the prompt/profile files, so editing any of them invalidates
+    previous results.
+    """
+    config_manager = get_config_manager()
+    models = [
+        getattr(config_manager.get_config_for_stage(stage), "model", "")
+        for stage in ("skills_extraction", "skills_matching", "job_scoring")
+    ]
+    # Every submitted field, minus the pipeline's own "_" parameters
+    job_fields = {k: v for k, v in job_data.items() if not k.startswith("_")}
+    parts = [
+        json.dumps(job_fields, sort_keys=True, default=str),
+        *models,
+        str(min_score),
+        str(heuristic_threshold),
+        *(
+            str(_file_mtime(path))
+            for path in (PROMPTS_FILE, RESUME_FILE, CANDIDATE_SKILLS_FILE)
+        ),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
 def process_single_job(
     job_data: Dict[str, Any],
     min_score: int = 0,
@@ -915,6 +967,11 @@ def process_single_job(
     """
     Synchronous wrapper for processing a single job.
 
+    Results that saved nothing (rejected or low score) are cached for a few
+    minutes by content hash, so a rerun that submits the same job again
+    returns a copy of the previous result instead of re-running the LLM
+    stages.
+
     Args:
         job_data: Job dictionary with all required fields
         min_score: Minimum score to save (default: 0)
@@ -923,6 +980,29 @@ def process_single_job(
     Returns:
         Dictionary with processed job data including pipeline results
     """
-    return asyncio.run(
+    key = single_job_cache_key(job_data, min_score, heuristic_threshold)
+    now = time.time()
+
+    cached = _SINGLE_JOB_CACHE.get(key)
+    if cached and now - cached[0] < SINGLE_JOB_CACHE_TTL:
+        logger.debug("Returning cached pipeline result for repeated submission")
+        return copy.deepcopy(cached[1])
+
+    result = asyncio.run(
         process_single_job_async(job_data, min_score, heuristic_threshold)
     )
+
+    if result.get("status") in SINGLE_JOB_CACHEABLE_STATUSES:
+        # Drop expired entries, then the oldest ones if still over capacity
+        for stale_key in [
+            k
+            for k, (ts, _) in _SINGLE_JOB_CACHE.items()
+            if now - ts >= SINGLE_JOB_CACHE_TTL
+        ]:
+            del _SINGLE_JOB_CACHE[stale_key]
+        while len(_SINGLE_JOB_CACHE) >= SINGLE_JOB_CACHE_SIZE:
+            del _SINGLE_JOB_CACHE[next(iter(_SINGLE_JOB_CACHE))]
+        # Stored as a copy so callers can't change the cached result
+        _SINGLE_JOB_CACHE[key] = (now, copy.deepcopy(result))
+
+    return result
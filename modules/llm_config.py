@@ -5,16 +5,16 @@ LLM Configuration Manager with per-stage configuration
 import os
 import logging
 from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from openai import OpenAI
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StageConfig:
-    """Configuration for a specific LLM stage"""
+    """Configuration for a specific LLM stage (immutable and hashable)"""
 
     stage_name: str
     api_key: str
@@ -22,17 +22,26 @@ class StageConfig:
     model: str = "gpt-4o-mini"
     temperature: float = 0.3
     max_tokens: int = 2000
+    _dict: Dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The instance is frozen, so its dictionary form can be built once
+        object.__setattr__(
+            self,
+            "_dict",
+            {
+                "stage_name": self.stage_name,
+                "api_key": self.api_key,
+                "base_url": self.base_url,
+                "model": self.model,
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens,
+            },
+        )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert config to dictionary"""
-        return {
-            "stage_name": self.stage_name,
-            "api_key": self.api_key,
-            "base_url": self.base_url,
-            "model": self.model,
-            "temperature": self.temperature,
-            "max_tokens": self.max_tokens,
-        }
+        """Convert config to dictionary (shared instance, do not mutate)"""
+        return self._dict
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StageConfig":
@@ -55,19 +64,50 @@ class LLMConfigManager:
         self.stages = ["skills_extraction", "skills_matching", "job_scoring", "chat"]
 
         # Load configurations for all stages
+        stage_env = self._scan_stage_env()
         self.stage_configs: Dict[str, StageConfig] = {}
         for stage in self.stages:
-            self.stage_configs[stage] = self._load_stage_config(stage)
+            self.stage_configs[stage] = self._load_stage_config(
+                stage, stage_env.get(stage)
+            )
+
+    def _scan_stage_env(self) -> Dict[str, Dict[str, str]]:
+        """Collect the per-stage settings from the environment in one pass.
+
+        Returns:
+            Mapping of stage name to {"API_KEY": ..., "BASE_URL": ..., "MODEL": ...}
+            containing only the variables that are set.
+        """
+        wanted = {
+            f"{stage.upper()}_{suffix}": (stage, suffix)
+            for stage in self.stages
+            for suffix in ("API_KEY", "BASE_URL", "MODEL")
+        }
+        stage_env: Dict[str, Dict[str, str]] = {stage: {} for stage in self.stages}
+        for key, value in os.environ.items():
+            match = wanted.get(key)
+            if match:
+                stage, suffix = match
+                stage_env[stage][suffix] = value
+        return stage_env
+
+    def _load_stage_config(
+        self, stage_name: str, env: Optional[Dict[str, str]] = None
+    ) -> StageConfig:
+        """Load configuration for a specific stage from environment variables
 
-    def _load_stage_config(self, stage_name: str) -> StageConfig:
-        """Load configuration for a specific stage from environment variables"""
-        # Convert stage name to uppercase with underscores for env var names
-        env_prefix = stage_name.upper()
+        Args:
+            stage_name: Stage to load.
+            env: Pre-scanned settings for this stage (see _scan_stage_env).
+                 Scanned from the environment when omitted.
+        """
+        if env is None:
+            env = self._scan_stage_env().get(stage_name, {})
 
         # Read from .env file using pattern: {STAGE}_API_KEY, {STAGE}_BASE_URL, {STAGE}_MODEL
-        api_key = os.getenv(f"{env_prefix}_API_KEY", "")
-        base_url = os.getenv(f"{env_prefix}_BASE_URL") or None
-        model = os.getenv(f"{env_prefix}_MODEL", "gpt-4o-mini")
+        api_key = env.get("API_KEY", "")
+        base_url = env.get("BASE_URL") or None
+        model = env.get("MODEL", "gpt-4o-mini")
 
         # Set appropriate temperature defaults
         temperature = 0.3  # Default for analytical tasks
@@ -162,8 +202,10 @@ class LLMConfigManager:
     def reload(self) -> None:
         """Reload environment variables and rebuild all stage configs."""
         load_dotenv(override=True)
+        stage_env = self._scan_stage_env()
         self.stage_configs = {
-            stage: self._load_stage_config(stage) for stage in self.stages
+            stage: self._load_stage_config(stage, stage_env.get(stage))
+            for stage in self.stages
         }
 
 
@@ -1,17 +1,534 @@
 """AI Tools tab for job analysis and chat."""
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
+import os
+import string
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
 from typing import Any
 
 import streamlit as st
+from openai import OpenAI
 
 from constants import PRESETS_FILE
 from modules.database import JobDatabase
-from modules.llm_config import get_config_manager
+from modules.llm_config import StageConfig, get_config_manager, reload_config_manager
 
 logger = logging.getLogger(__name__)
 
+# Re-render the streamed reply every N chunks rather than on every token
+STREAM_RENDER_EVERY = 4
+
+# Default number of user/assistant turns sent to the model with each request.
+# The system message already carries the full job context.
+MAX_HISTORY_TURNS = 12
+
+# Quick Prompt replies are generated at temperature 0, so an identical request
+# (same job, preset and model) is answered from cache for an hour
+PRESET_REPLY_TTL = 3600
+PRESET_REPLY_CACHE_SIZE = 128
+
+# Chat histories kept per session (least recently viewed jobs are dropped)
+# and messages kept per job
+MAX_CHAT_JOBS = 16
+MAX_CHAT_MESSAGES = 40
+
+# Placeholders available in preset user prompt templates
+PROMPT_FIELDS = ("title", "company", "location", "description")
+
+# Job details sent in the system message of every chat request
+JOB_CONTEXT_TEMPLATE = (
+    "Job Title: {title}\nCompany: {company}\nLocation: {location}\n"
+    "Job Description: {description}"
+)
+
+
+def load_presets() -> None:
+    """Load chat presets from the presets JSON file into session state.
+
+    The file is only parsed on first load or when its modification time
+    changed since the last load (e.g. edited externally or from another
+    session); otherwise this is a single stat call.
+    """
+    try:
+        mtime = os.path.getmtime(PRESETS_FILE)
+    except FileNotFoundError:
+        mtime = None
+
+    if "presets" in st.session_state and st.session_state.get("presets_mtime") == mtime:
+        return
+
+    try:
+        # Read in binary mode; json.loads handles the UTF-8 decoding
+        presets = json.loads(Path(PRESETS_FILE).read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+        # Keep the presets already loaded if the file is unreadable
+        presets = st.session_state.get("presets", {})
+
+    st.session_state.presets = presets
+    st.session_state.presets_mtime = mtime
+    # The file no longer matches what this session last wrote
+    st.session_state.pop("presets_hash", None)
+
+
+def save_presets() -> None:
+    """Persist chat presets to the presets JSON file.
+
+    The file is replaced atomically and left untouched when the serialized
+    presets are identical to what was last written.
+    """
+    data = json.dumps(st.session_state.presets, indent=2).encode("utf-8")
+    digest = hashlib.blake2b(data).digest()
+    if st.session_state.get("presets_hash") == digest:
+        return
+
+    tmp_path = f"{PRESETS_FILE}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, PRESETS_FILE)
+    st.session_state.presets_hash = digest
+    st.session_state.presets_mtime = os.path.getmtime(PRESETS_FILE)
+
+
+@st.cache_data(show_spinner=False)
+def build_job_options(
+    jobs_fingerprint: tuple[tuple[Any, ...], ...],
+) -> dict[str, int]:
+    """Build the job selector labels.
+
+    Args:
+        jobs_fingerprint: (id, title, company, llm_score) for each job, in
+            display order. Only these fields affect the labels, so the
+            result is cached until one of them changes.
+
+    Returns:
+        Mapping of selector label to the job's position in the jobs list.
+    """
+    return {
+        f"{title} @ {company} (Score: {llm_score or 0}/10)": idx
+        for idx, (_, title, company, llm_score) in enumerate(jobs_fingerprint)
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def compile_prompt_template(
+    template: str,
+) -> tuple[tuple[str, str | None, str | None, str | None], ...]:
+    """Parse a preset prompt template once.
+
+    Args:
+        template: Template using {title}, {company}, {location}, {description}.
+
+    Returns:
+        The (literal, field, format_spec, conversion) tuples of the template.
+    """
+    return tuple(string.Formatter().parse(template))
+
+
+def validate_prompt_template(template: str) -> str | None:
+    """Check that a preset prompt template can be filled.
+
+    Args:
+        template: Template to check.
+
+    Returns:
+        An error message, or None if the template is valid.
+    """
+    try:
+        parsed = compile_prompt_template(template)
+    except ValueError as e:
+        return f"Invalid template: {e}"
+
+    unknown = sorted(
+        {field for _, field, _, _ in parsed if field is not None} - set(PROMPT_FIELDS)
+    )
+    if unknown:
+        placeholders = ", ".join(f"{{{field}}}" for field in unknown)
+        allowed = ", ".join(f"{{{field}}}" for field in PROMPT_FIELDS)
+        return f"Unknown placeholders: {placeholders}. Use {allowed}"
+
+    for _, field, format_spec, conversion in parsed:
+        if field is None:
+            continue
+        if conversion not in (None, "s", "r", "a"):
+            return f"Invalid conversion !{conversion} in {{{field}}}. Use !s, !r or !a"
+        if format_spec and ("{" in format_spec or "}" in format_spec):
+            return f"Nested placeholders are not supported in {{{field}}}"
+        try:
+            # Fields are filled with text, so the spec must apply to a str
+            format("", format_spec or "")
+        except ValueError as e:
+            return f"Invalid format in {{{field}}}: {e}"
+    return None
+
+
+def fill_prompt_template(template: str, fields: dict[str, Any]) -> str:
+    """Fill a preset prompt template, equivalent to template.format(**fields).
+
+    Args:
+        template: Template to fill.
+        fields: Values for the template's fields.
+
+    Returns:
+        The filled prompt.
+
+    Raises:
+        KeyError: If the template uses a field that is not provided.
+    """
+    parts: list[str] = []
+    for literal, field_name, format_spec, conversion in compile_prompt_template(
+        template
+    ):
+        parts.append(literal)
+        if field_name is None:
+            continue
+        value = fields[field_name]
+        if conversion:
+            value = {"r": repr, "s": str, "a": ascii}[conversion](value)
+        parts.append(format(value, format_spec or ""))
+    return "".join(parts)
+
+
+def get_chat_client() -> tuple[StageConfig | None, OpenAI | None]:
+    """Get the chat stage config and client, reusing the session's client.
+
+    The client is rebuilt only when the chat stage configuration changes
+    (e.g. after saving .env), so chat turns don't construct a new client.
+
+    Returns:
+        Tuple of (chat stage config, OpenAI client or None).
+    """
+    config = get_config_manager().get_config_for_stage("chat")
+    cached = st.session_state.get("chat_client")
+    if cached is None or cached[0] != config:
+        client = get_config_manager().get_client_for_stage("chat")
+        st.session_state.chat_client = (config, client)
+    return st.session_state.chat_client
+
+
+@st.cache_resource
+def get_preset_reply_cache() -> tuple[threading.Lock, dict[str, tuple[float, str]]]:
+    """Get the process-wide cache of Quick Prompt replies.
+
+    Every session runs its script in its own thread, so the cache comes with
+    a lock that must be held while reading or changing it.
+
+    Returns:
+        Tuple of (lock, mapping of request digest to (timestamp, reply)).
+    """
+    return threading.Lock(), {}
+
+
+def store_preset_reply(cache_key: str, reply: str) -> None:
+    """Cache a Quick Prompt reply, evicting expired and then oldest entries.
+
+    Args:
+        cache_key: Digest of the request (see run_chat_turn).
+        reply: The assistant's reply.
+    """
+    lock, cache = get_preset_reply_cache()
+    now = time.time()
+    with lock:
+        for key in [k for k, (ts, _) in cache.items() if now - ts >= PRESET_REPLY_TTL]:
+            del cache[key]
+        while len(cache) >= PRESET_REPLY_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[cache_key] = (now, reply)
+
+
+def preset_reply_cache_key(
+    config: StageConfig | None, messages: list[dict[str, str]]
+) -> str:
+    """Digest identifying a Quick Prompt request for the reply cache.
+
+    Args:
+        config: Chat stage config (only the model is part of the key).
+        messages: Messages sent to the model.
+
+    Returns:
+        Hex digest of the model and messages.
+    """
+    payload = json.dumps([config.model if config else None, messages])
+    return hashlib.blake2b(payload.encode("utf-8")).hexdigest()
+
+
+def get_cached_preset_reply(cache_key: str) -> str | None:
+    """Get a cached Quick Prompt reply that has not expired.
+
+    Args:
+        cache_key: Digest of the request (see preset_reply_cache_key).
+
+    Returns:
+        The cached reply, or None.
+    """
+    lock, cache = get_preset_reply_cache()
+    with lock:
+        cached = cache.get(cache_key)
+    if cached and time.time() - cached[0] < PRESET_REPLY_TTL:
+        return cached[1]
+    return None
+
+
+def build_system_message(job_context: str, preset: dict[str, Any] | None) -> str:
+    """Build the chat system message for a job.
+
+    Args:
+        job_context: Job details formatted with JOB_CONTEXT_TEMPLATE.
+        preset: Preset whose system prompt should be used, if any.
+
+    Returns:
+        The system message.
+    """
+    if preset and preset.get("system_prompt"):
+        return preset["system_prompt"] + "\n\n" + job_context
+    return f"You are a helpful assistant that answers questions about this job. Here is the job information:\n{job_context}"
+
+
+def stream_chat_reply(
+    messages: list[dict[str, str]],
+    temperature: float = 0.7,
+    cache_key: str | None = None,
+) -> str:
+    """Stream a chat completion into the current container.
+
+    Args:
+        messages: Messages to send, starting with the system message.
+        temperature: Sampling temperature.
+        cache_key: If given, a successful reply is stored in the Quick
+            Prompt reply cache under this key.
+
+    Returns:
+        The full reply, or an error message if the call failed.
+    """
+    config, client = get_chat_client()
+
+    if not client:
+        reply = "❌ Chat LLM is not configured. Please check your .env file."
+        st.markdown(reply)
+        return reply
+
+    placeholder = st.empty()
+    parts: list[str] = []
+    try:
+        stream = client.chat.completions.create(
+            model=config.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=500,
+            stream=True,
+        )
+        for chunk_idx, chunk in enumerate(stream, 1):
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+            if chunk_idx % STREAM_RENDER_EVERY == 0:
+                placeholder.markdown("".join(parts) + "▌")
+        reply = "".join(parts)
+        if cache_key:
+            store_preset_reply(cache_key, reply)
+    except Exception as e:
+        reply = f"❌ Error: {str(e)}"
+
+    placeholder.markdown(reply)
+    return reply
+
+
+def run_chat_turn(
+    job_context: str,
+    chat_history: list[dict[str, str]],
+    preset: dict[str, Any] | None,
+    use_cache: bool = False,
+) -> str:
+    """Answer the latest message in a job chat.
+
+    Builds the system message from the job context (and the preset's system
+    prompt, if any), adds the most recent turns of the conversation and
+    streams the reply into the current container. Quick Prompts are sent
+    without the earlier turns, as in run_all_presets, so repeating one gives
+    the same request and can be answered from the cache.
+
+    Args:
+        job_context: Job details formatted with JOB_CONTEXT_TEMPLATE.
+        chat_history: Conversation so far, ending with the user's message.
+        preset: Preset whose system prompt should be used, if any.
+        use_cache: Send only the latest message, answer at temperature 0 and
+            reuse an earlier reply to the identical request. Used for Quick
+            Prompts, which are repeated.
+
+    Returns:
+        The assistant's reply.
+    """
+    messages = [
+        {"role": "system", "content": build_system_message(job_context, preset)}
+    ]
+    if not use_cache:
+        for msg in chat_history[-st.session_state.max_history * 2 :]:
+            if msg["role"] in ("user", "assistant"):
+                # Only the fields the API accepts (Run-all replies carry a label)
+                messages.append({"role": msg["role"], "content": msg["content"]})
+        return stream_chat_reply(messages)
+
+    # The cache key covers these messages, so leave the history out
+    messages.append({"role": "user", "content": chat_history[-1]["content"]})
+
+    config, _ = get_chat_client()
+    cache_key = preset_reply_cache_key(config, messages)
+    cached = get_cached_preset_reply(cache_key)
+    if cached is not None:
+        st.markdown(cached)
+        return cached
+
+    return stream_chat_reply(messages, temperature=0.0, cache_key=cache_key)
+
+
+async def gather_chat_replies(
+    client: OpenAI, model: str, requests: list[list[dict[str, str]]]
+) -> list[Any]:
+    """Send several chat requests concurrently.
+
+    Args:
+        client: OpenAI client.
+        model: Model name.
+        requests: Messages for each request.
+
+    Returns:
+        A completion or the raised exception for each request, in order.
+    """
+    tasks = [
+        asyncio.to_thread(
+            client.chat.completions.create,
+            model=model,
+            messages=messages,
+            temperature=0.0,
+            max_tokens=500,
+        )
+        for messages in requests
+    ]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def run_all_presets(
+    job_context: str, prompt_fields: dict[str, Any]
+) -> list[tuple[str, str, str]]:
+    """Run every valid preset against a job in parallel.
+
+    Each preset is sent on its own (system message and filled prompt, without
+    the chat history). Replies go through the Quick Prompt reply cache, so
+    only uncached presets call the API.
+
+    Args:
+        job_context: Job details formatted with JOB_CONTEXT_TEMPLATE.
+        prompt_fields: Values for the preset template placeholders.
+
+    Returns:
+        (preset name, filled prompt, reply) for each preset that was run.
+    """
+    config, client = get_chat_client()
+    if not client:
+        st.error("❌ Chat LLM is not configured. Please check your .env file.")
+        return []
+
+    results: list[tuple[str, str, str]] = []
+    pending: list[tuple[int, str, list[dict[str, str]]]] = []
+    for preset_name, preset in st.session_state.presets.items():
+        if validate_prompt_template(preset["user_prompt"]):
+            continue
+        filled_prompt = fill_prompt_template(preset["user_prompt"], prompt_fields)
+        messages = [
+            {"role": "system", "content": build_system_message(job_context, preset)},
+            {"role": "user", "content": filled_prompt},
+        ]
+        cache_key = preset_reply_cache_key(config, messages)
+        cached = get_cached_preset_reply(cache_key)
+        if cached is None:
+            pending.append((len(results), cache_key, messages))
+        results.append((preset_name, filled_prompt, cached or ""))
+
+    if pending:
+        responses = asyncio.run(
+            gather_chat_replies(
+                client, config.model, [messages for _, _, messages in pending]
+            )
+        )
+
+        for (idx, cache_key, _), response in zip(pending, responses):
+            if isinstance(response, Exception):
+                reply = f"❌ Error: {str(response)}"
+            else:
+                reply = response.choices[0].message.content or ""
+                store_preset_reply(cache_key, reply)
+            name, filled_prompt, _ = results[idx]
+            results[idx] = (name, filled_prompt, reply)
+
+    return results
+
+
+@st.fragment
+def render_chat_panel(
+    job_context: str,
+    chat_history: list[dict[str, str]],
+) -> None:
+    """Render the chat history, the chat input and any pending reply.
+
+    Runs as a fragment, so submitting a chat message reruns only this panel
+    instead of the job selector, sidebar and preset forms.
+
+    Args:
+        job_context: Job details formatted with JOB_CONTEXT_TEMPLATE.
+        chat_history: Live reference to the job's chat history.
+    """
+    st.markdown("### 💬 Chat")
+
+    # Chat container with fixed height
+    chat_container = st.container(height=500)
+
+    with chat_container:
+        if not chat_history:
+            st.info(
+                "👋 Start chatting by asking a question below, or use a Quick Prompt from the sidebar!"
+            )
+        else:
+            for message in chat_history:
+                with st.chat_message(message["role"]):
+                    # Run-all replies are labelled with the preset they answer
+                    if message.get("preset"):
+                        st.markdown(f"**📌 {message['preset']}**")
+                    st.markdown(message["content"])
+
+        # Reply requested by a Quick Prompt in this run
+        if st.session_state.pop("pending_chat_reply", False):
+            with st.chat_message("assistant"):
+                reply = run_chat_turn(
+                    job_context,
+                    chat_history,
+                    st.session_state.selected_preset,
+                    use_cache=True,
+                )
+            chat_history.append({"role": "assistant", "content": reply})
+
+    # Chat input at the bottom
+    if prompt := st.chat_input("Ask about this job..."):
+        # Add user message
+        chat_history.append({"role": "user", "content": prompt})
+
+        # Render the new turn in place instead of rerunning the whole tab
+        with chat_container:
+            with st.chat_message("user"):
+                st.markdown(prompt)
+            with st.chat_message("assistant"):
+                reply = run_chat_turn(
+                    job_context,
+                    chat_history,
+                    st.session_state.selected_preset,
+                )
+
+        chat_history.append({"role": "assistant", "content": reply})
+
 
 def render_ai_tools(db: JobDatabase, jobs: list[dict[str, Any]]) -> None:
     """Render the AI Tools tab.
@@ -23,21 +540,20 @@ def render_ai_tools(db: JobDatabase, jobs: list[dict[str, Any]]) -> None:
 
     st.title("🤖 AI Tools")
 
-    # Initialize session state for presets
-    if "presets" not in st.session_state:
-        try:
-            with open(PRESETS_FILE, "r", encoding="utf-8") as f:
-                st.session_state.presets = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            st.session_state.presets = {}
+    # Initialize session state for presets (and pick up external edits)
+    load_presets()
 
     # Initialize session state for job chat
     if "job_chat_history" not in st.session_state:
-        st.session_state.job_chat_history = {}
+        st.session_state.job_chat_history = OrderedDict()
     if "selected_job_for_chat" not in st.session_state:
         st.session_state.selected_job_for_chat = None
     if "selected_preset" not in st.session_state:
         st.session_state.selected_preset = None
+    if "max_history" not in st.session_state:
+        st.session_state.max_history = MAX_HISTORY_TURNS
+    if "show_presets" not in st.session_state:
+        st.session_state.show_presets = True
 
     # ==================== JOB SELECTION ====================
     if not jobs:
@@ -47,24 +563,41 @@ def render_ai_tools(db: JobDatabase, jobs: list[dict[str, Any]]) -> None:
         return
 
     # Job selector at the top
-    job_options = {
-        f"{j['title']} @ {j['company']} (Score: {j['llm_score'] or 0}/10)": j
-        for j in jobs
-    }
+    job_options = build_job_options(
+        tuple((j["id"], j["title"], j["company"], j["llm_score"]) for j in jobs)
+    )
     selected_job_label = st.selectbox(
         "💼 Select a job to chat about",
         options=list(job_options.keys()),
         key="job_chat_select",
     )
-    selected_job = job_options[selected_job_label]
+    selected_job = jobs[job_options[selected_job_label]]
+
+    # Description variants used by the presets and the chat context
+    desc_full = selected_job["description"] or ""
+    desc_preview = desc_full[:500] + "..." if len(desc_full) > 500 else desc_full
+    job_context = JOB_CONTEXT_TEMPLATE.format(
+        title=selected_job["title"],
+        company=selected_job["company"],
+        location=selected_job["location"],
+        description=desc_full,
+    )
 
     # When a new job is selected, reset the chat history for that job if not exists
     if st.session_state.selected_job_for_chat != selected_job["id"]:
         st.session_state.selected_job_for_chat = selected_job["id"]
-        if selected_job["id"] not in st.session_state.job_chat_history:
-            st.session_state.job_chat_history[selected_job["id"]] = []
-
+        histories = st.session_state.job_chat_history
+        if selected_job["id"] not in histories:
+            histories[selected_job["id"]] = []
+        histories.move_to_end(selected_job["id"])
+        while len(histories) > MAX_CHAT_JOBS:
+            histories.popitem(last=False)
+
+    # Live reference to the session's list: appending to chat_history updates
+    # st.session_state directly, so it never needs to be assigned back
     chat_history = st.session_state.job_chat_history[selected_job["id"]]
+    if len(chat_history) > MAX_CHAT_MESSAGES:
+        del chat_history[:-MAX_CHAT_MESSAGES]
 
     # ==================== MAIN LAYOUT: SIDEBAR + CHAT ====================
     col_sidebar, col_chat = st.columns([1, 2])
@@ -80,90 +613,100 @@ def render_ai_tools(db: JobDatabase, jobs: list[dict[str, Any]]) -> None:
 
             # Show description preview (expanded by default)
             with st.expander("📄 Job Description", expanded=True):
-                description = selected_job["description"] or "No description available"
-                # Show first 600 characters with scroll
-                st.markdown(description, unsafe_allow_html=True)
+                description = desc_full or "No description available"
+                # Markdown is rendered by the browser; a fixed-height scroll
+                # area keeps long descriptions from laying out the full page
+                with st.container(height=400, border=False):
+                    st.markdown(description, unsafe_allow_html=True)
 
         st.divider()
 
         # Chat controls
         st.markdown("### 🎛️ Controls")
-        col_reset, col_messages = st.columns(2)
+        col_reset, col_reload, col_messages = st.columns(3)
         with col_reset:
             if st.button("🔄 Reset", width="stretch", key="reset_chat"):
                 st.session_state.job_chat_history[selected_job["id"]] = []
                 st.session_state.selected_preset = None
                 st.rerun()
+        with col_reload:
+            if st.button(
+                "🔌 Reload",
+                width="stretch",
+                key="reload_chat_config",
+                help="Reload the chat LLM settings from .env",
+            ):
+                reload_config_manager()
+                st.session_state.pop("chat_client", None)
+                st.toast("✓ Chat configuration reloaded")
         with col_messages:
             st.metric("Messages", len(chat_history), label_visibility="collapsed")
 
+        st.slider(
+            "History turns sent to the model",
+            min_value=1,
+            max_value=MAX_CHAT_MESSAGES // 2,
+            key="max_history",
+            help="Only the most recent turns are sent with each request",
+        )
+
         st.divider()
 
-        # Preset quick actions
-        st.markdown("### 🎯 Quick Prompts")
-
-        if st.session_state.presets:
-            for preset_name, preset in st.session_state.presets.items():
-                # Create a button for each preset
-                button_label = f"📌 {preset_name}"
-                if st.button(
-                    button_label, key=f"preset_quick_{preset_name}", width="stretch"
-                ):
-                    # Fill template
-                    filled_prompt = preset["user_prompt"].format(
-                        title=selected_job["title"],
-                        company=selected_job["company"],
-                        location=selected_job["location"],
-                        description=selected_job["description"][:500] + "..."
-                        if len(selected_job["description"]) > 500
-                        else selected_job["description"],
-                    )
+        # Preset quick actions: a selector and one Run button, so the widget
+        # count stays the same however many presets there are
+        show_presets = st.toggle("🎯 Quick Prompts", key="show_presets")
+
+        if show_presets and st.session_state.presets:
+            prompt_fields = {
+                "title": selected_job["title"],
+                "company": selected_job["company"],
+                "location": selected_job["location"],
+                "description": desc_preview,
+            }
+            preset_name = st.selectbox(
+                "Quick Prompt",
+                options=list(st.session_state.presets),
+                key="quick_prompt_select",
+                label_visibility="collapsed",
+            )
+            col_run, col_run_all = st.columns(2)
+            with col_run:
+                clicked = st.button(
+                    "▶️ Run Prompt", key="quick_prompt_run", width="stretch"
+                )
+            with col_run_all:
+                run_all_clicked = st.button(
+                    "🚀 Run all",
+                    key="quick_prompt_run_all",
+                    width="stretch",
+                    help="Run every preset against this job in parallel",
+                )
+            preset = st.session_state.presets.get(preset_name)
+            if clicked and preset and validate_prompt_template(preset["user_prompt"]):
+                st.toast(f"⚠️ Preset '{preset_name}' has an invalid template")
+            elif clicked and preset:
+                # Fill template
+                filled_prompt = fill_prompt_template(
+                    preset["user_prompt"], prompt_fields
+                )
 
-                    # Add to chat
-                    chat_history.append({"role": "user", "content": filled_prompt})
-                    st.session_state.selected_preset = preset
-
-                    # Get AI response
-                    with st.spinner("Thinking..."):
-                        context = f"""
-                        Job Title: {selected_job["title"]}
-                        Company: {selected_job["company"]}
-                        Location: {selected_job["location"]}
-                        Job Description: {selected_job["description"]}
-                        """
-
-                        system_message = f"You are a helpful assistant that answers questions about this job. Here is the job information:\n{context}"
-                        if preset.get("system_prompt"):
-                            system_message = preset["system_prompt"] + "\n\n" + context
-
-                        config_manager = get_config_manager()
-                        client = config_manager.get_client_for_stage("chat")
-
-                        if client:
-                            messages = [{"role": "system", "content": system_message}]
-                            for msg in chat_history:
-                                if msg["role"] in ("user", "assistant"):
-                                    messages.append(msg)
-                            try:
-                                response = client.chat.completions.create(
-                                    model=config_manager.get_config_for_stage(
-                                        "chat"
-                                    ).model,
-                                    messages=messages,
-                                    temperature=0.7,
-                                    max_tokens=500,
-                                )
-                                reply = response.choices[0].message.content
-                            except Exception as e:
-                                reply = f"❌ Error: {str(e)}"
-                        else:
-                            reply = "❌ Chat LLM is not configured. Please check your .env file."
+                # Add to chat
+                chat_history.append({"role": "user", "content": filled_prompt})
+                st.session_state.selected_preset = preset
 
-                        chat_history.append({"role": "assistant", "content": reply})
+                # The reply is streamed into the chat panel further down
+                st.session_state.pending_chat_reply = True
 
-                    st.session_state.job_chat_history[selected_job["id"]] = chat_history
-                    st.rerun()
-        else:
+            if run_all_clicked:
+                with st.spinner("Running all presets..."):
+                    results = run_all_presets(job_context, prompt_fields)
+                for name, filled_prompt, reply in results:
+                    chat_history.append({"role": "user", "content": filled_prompt})
+                    # The label is kept apart so the model only sees the reply
+                    chat_history.append(
+                        {"role": "assistant", "content": reply, "preset": name}
+                    )
+        elif show_presets:
             st.info("💡 Create presets below to get quick prompts here")
 
         st.divider()
@@ -191,7 +734,10 @@ def render_ai_tools(db: JobDatabase, jobs: list[dict[str, Any]]) -> None:
 
                     if st.form_submit_button("Create Preset", width="stretch"):
                         if new_name and new_user:
-                            if new_name in st.session_state.presets:
+                            template_error = validate_prompt_template(new_user)
+                            if template_error:
+                                st.error(template_error)
+                            elif new_name in st.session_state.presets:
                                 st.error(f"Preset '{new_name}' already exists")
                             else:
                                 st.session_state.presets[new_name] = {
@@ -199,8 +745,7 @@ def render_ai_tools(db: JobDatabase, jobs: list[dict[str, Any]]) -> None:
                                     "system_prompt": new_system,
                                     "user_prompt": new_user,
                                 }
-                                with open(PRESETS_FILE, "w", encoding="utf-8") as f:
-                                    json.dump(st.session_state.presets, f, indent=2)
+                                save_presets()
                                 st.toast(f"✓ Created '{new_name}'")
                                 st.rerun()
                         else:
@@ -229,7 +774,10 @@ def render_ai_tools(db: JobDatabase, jobs: list[dict[str, Any]]) -> None:
                             col1, col2 = st.columns(2)
                             with col1:
                                 if st.form_submit_button("💾 Update", width="stretch"):
-                                    if edit_name != preset_to_edit:
+                                    template_error = validate_prompt_template(edit_user)
+                                    if template_error:
+                                        st.error(template_error)
+                                    elif edit_name != preset_to_edit:
                                         if edit_name in st.session_state.presets:
                                             st.error(f"'{edit_name}' already exists")
                                         else:
@@ -239,14 +787,7 @@ def render_ai_tools(db: JobDatabase, jobs: list[dict[str, Any]]) -> None:
                                                 "system_prompt": edit_system,
                                                 "user_prompt": edit_user,
                                             }
-                                            with open(
-                                                PRESETS_FILE, "w", encoding="utf-8"
-                                            ) as f:
-                                                json.dump(
-                                                    st.session_state.presets,
-                                                    f,
-                                                    indent=2,
-                                                )
+                                            save_presets()
                                             st.toast("✓ Updated")
                                             st.rerun()
                                     else:
@@ -255,20 +796,14 @@ def render_ai_tools(db: JobDatabase, jobs: list[dict[str, Any]]) -> None:
                                             "system_prompt": edit_system,
                                             "user_prompt": edit_user,
                                         }
-                                        with open(
-                                            PRESETS_FILE, "w", encoding="utf-8"
-                                        ) as f:
-                                            json.dump(
-                                                st.session_state.presets, f, indent=2
-                                            )
+                                        save_presets()
                                         st.toast("✓ Updated")
                                         st.rerun()
 
                             with col2:
                                 if st.form_submit_button("🗑️ Delete", width="stretch"):
                                     del st.session_state.presets[preset_to_edit]
-                                    with open(PRESETS_FILE, "w", encoding="utf-8") as f:
-                                        json.dump(st.session_state.presets, f, indent=2)
+                                    save_presets()
                                     st.toast("✓ Deleted")
                                     st.rerun()
                 else:
@@ -276,68 +811,4 @@ def render_ai_tools(db: JobDatabase, jobs: list[dict[str, Any]]) -> None:
 
     # ==================== RIGHT SIDE: CHAT INTERFACE ====================
     with col_chat:
-        st.markdown("### 💬 Chat")
-
-        # Chat container with fixed height
-        chat_container = st.container(height=500)
-
-        with chat_container:
-            if not chat_history:
-                st.info(
-                    "👋 Start chatting by asking a question below, or use a Quick Prompt from the sidebar!"
-                )
-            else:
-                for message in chat_history:
-                    with st.chat_message(message["role"]):
-                        st.markdown(message["content"])
-
-        # Chat input at the bottom
-        if prompt := st.chat_input("Ask about this job..."):
-            # Add user message
-            chat_history.append({"role": "user", "content": prompt})
-
-            # Generate response
-            with st.spinner("Thinking..."):
-                context = f"""
-                Job Title: {selected_job["title"]}
-                Company: {selected_job["company"]}
-                Location: {selected_job["location"]}
-                Job Description: {selected_job["description"]}
-                """
-
-                system_message = f"You are a helpful assistant that answers questions about this job. Here is the job information:\n{context}"
-                if (
-                    st.session_state.selected_preset
-                    and st.session_state.selected_preset.get("system_prompt")
-                ):
-                    system_message = (
-                        st.session_state.selected_preset["system_prompt"]
-                        + "\n\n"
-                        + context
-                    )
-
-                config_manager = get_config_manager()
-                client = config_manager.get_client_for_stage("chat")
-
-                if client:
-                    messages = [{"role": "system", "content": system_message}]
-                    messages.extend(chat_history)
-                    try:
-                        response = client.chat.completions.create(
-                            model=config_manager.get_config_for_stage("chat").model,
-                            messages=messages,
-                            temperature=0.7,
-                            max_tokens=500,
-                        )
-                        reply = response.choices[0].message.content
-                    except Exception as e:
-                        reply = f"❌ Error: {str(e)}"
-                else:
-                    reply = (
-                        "❌ Chat LLM is not configured. Please check your .env file."
-                    )
-
-                chat_history.append({"role": "assistant", "content": reply})
-
-            st.session_state.job_chat_history[selected_job["id"]] = chat_history
-            st.rerun()
+        render_chat_panel(job_context, chat_history)
@@ -2,11 +2,17 @@
 
 import json
 import logging
+import queue
+import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
 from constants import QUERIES_FILE
@@ -23,6 +29,22 @@ VIZ_TYPES = {
     "metric": "🎯 Metric Cards",
 }
 
+# Read-only connections shared by all sessions
+READ_POOL_SIZE = 4
+
+# Bar and pie charts show at most this many categories plus "Other"
+MAX_CHART_CATEGORIES = 30
+
+# Line charts with more points than this are drawn with WebGL instead of SVG
+WEBGL_MIN_POINTS = 1000
+
+# Line charts are downsampled (LTTB) to this many points
+LINE_MAX_POINTS = 2000
+
+# dtype kinds treated as numeric (bool, int, uint, float, complex), the same
+# set pd.api.types.is_numeric_dtype accepts
+NUMERIC_KINDS = frozenset("biufc")
+
 
 def save_queries() -> None:
     """Persist saved analytics queries to the queries JSON file."""
@@ -30,6 +52,62 @@ def save_queries() -> None:
         json.dump(st.session_state.saved_queries, f, indent=4)
 
 
+@st.cache_resource
+def get_read_pool(_db: JobDatabase) -> queue.Queue[sqlite3.Connection]:
+    """Get the pool of read-only connections used by the analytics queries.
+
+    Args:
+        _db: Database instance (not hashed; the app uses a single database).
+
+    Returns:
+        Queue holding READ_POOL_SIZE open read-only connections.
+    """
+    pool: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=READ_POOL_SIZE)
+    for _ in range(READ_POOL_SIZE):
+        pool.put(_db.get_read_only_conn())
+    return pool
+
+
+@contextmanager
+def read_connection(db: JobDatabase) -> Iterator[sqlite3.Connection]:
+    """Borrow a read-only connection from the pool.
+
+    Args:
+        db: Database instance.
+
+    Yields:
+        Read-only connection, returned to the pool (not closed) afterwards.
+    """
+    pool = get_read_pool(db)
+    conn = pool.get()
+    try:
+        yield conn
+    finally:
+        # A query that opened a transaction would pin later reads to a stale
+        # snapshot
+        if conn.in_transaction:
+            conn.rollback()
+        pool.put(conn)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_query_results(_db: JobDatabase, query: str) -> pd.DataFrame:
+    """Run a read-only query, caching the result by SQL text.
+
+    Args:
+        _db: Database instance (not hashed; the app uses a single database).
+        query: SQL query string.
+
+    Returns:
+        Query results.
+    """
+    with read_connection(_db) as conn:
+        cursor = conn.execute(query)
+        rows = cursor.fetchall()
+        columns = [d[0] for d in cursor.description or ()]
+    return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+
 def render_analytics_tab(db: JobDatabase) -> None:
     """Render the analytics interface.
 
@@ -38,8 +116,6 @@ def render_analytics_tab(db: JobDatabase) -> None:
     """
     st.title("📊 Analytics")
 
-    ro_conn = db.get_read_only_conn()
-
     # Initialize session state for saved queries
     if "saved_queries" not in st.session_state:
         try:
@@ -53,7 +129,7 @@ def render_analytics_tab(db: JobDatabase) -> None:
 
     # Schema reference at top (collapsible)
     with st.expander("📚 Database Schema Reference"):
-        render_schema_reference(ro_conn)
+        render_schema_reference(db)
 
     # Main layout: left sidebar with queries, right area with results
     col_left, col_right = st.columns([1, 2])
@@ -66,11 +142,10 @@ def render_analytics_tab(db: JobDatabase) -> None:
         if "selected_query_name" not in st.session_state:
             st.session_state.selected_query_name = ""
 
-        saved_query_names = list(st.session_state.saved_queries.keys())
-        if st.session_state.selected_query_name not in saved_query_names:
+        if st.session_state.selected_query_name not in st.session_state.saved_queries:
             st.session_state.selected_query_name = ""
 
-        query_options = [""] + saved_query_names
+        query_options = ["", *st.session_state.saved_queries]
 
         # Query selector
         selected_query_name = st.selectbox(
@@ -259,7 +334,18 @@ def render_analytics_tab(db: JobDatabase) -> None:
         st.divider()
 
         # Run button
-        run_query = st.button("▶️ Run Query", type="primary", width="stretch")
+        col_run, col_refresh = st.columns([3, 1])
+        with col_run:
+            run_query = st.button("▶️ Run Query", type="primary", width="stretch")
+        with col_refresh:
+            if st.button(
+                "🔄",
+                width="stretch",
+                key="refresh_query",
+                help="Discard cached results and run the query again",
+            ):
+                fetch_query_results.clear()
+                run_query = True
 
     # ==================== RIGHT COLUMN: Results ====================
     with col_right:
@@ -269,7 +355,7 @@ def render_analytics_tab(db: JobDatabase) -> None:
             if not query_text or query_text.strip() == "":
                 st.warning("⚠️ Please enter a SQL query first")
             else:
-                execute_query_with_viz(ro_conn, query_text, viz_type)
+                execute_query_with_viz(db, query_text, viz_type)
         elif st.session_state.get("last_result") is not None:
             # Show last result if available
             df, last_viz = st.session_state.last_result
@@ -289,74 +375,93 @@ def render_analytics_tab(db: JobDatabase) -> None:
             - **Metric Cards**: Show 1-4 key numbers
             - **Horizontal Bar**: Good for long labels
             """)
-        ro_conn.close()
 
 
-def render_schema_reference(conn: Any) -> None:
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_table_schema(
+    _db: JobDatabase, table: str
+) -> tuple[list[tuple[Any, ...]], int, tuple[Any, ...] | None]:
+    """Fetch the schema reference data for a table.
+
+    Cached briefly: the schema never changes and the row count only needs
+    to be roughly current.
+
+    Args:
+        _db: Database instance (not hashed; the app uses a single database).
+        table: Table name.
+
+    Returns:
+        Tuple of (PRAGMA table_info rows, row count, example row or None).
+    """
+    with read_connection(_db) as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"PRAGMA table_info({table})")
+        columns = cursor.fetchall()
+
+        cursor.execute(f"SELECT COUNT(*) FROM {table}")
+        row_count = cursor.fetchone()[0]
+
+        try:
+            cursor.execute(f"SELECT * FROM {table} LIMIT 1")
+            example_row = cursor.fetchone()
+        except Exception:
+            example_row = None
+
+    return columns, row_count, example_row
+
+
+def render_schema_reference(db: JobDatabase) -> None:
     """Render database schema with examples.
 
     Args:
-        conn: Database connection.
+        db: Database instance.
     """
-    tables = ["jobs", "applications", "interview_stages"]
+    tables = ["jobs", "applications", "interview_stages", "job_skills"]
 
     for table in tables:
         with st.expander(f"📋 **{table}**"):
-            # Get columns
-            cursor = conn.cursor()
-            cursor.execute(f"PRAGMA table_info({table})")
-            columns = cursor.fetchall()
-
-            # Get row count
-            cursor.execute(f"SELECT COUNT(*) FROM {table}")
-            row_count = cursor.fetchone()[0]
+            columns, row_count, example_row = fetch_table_schema(db, table)
 
             st.caption(f"**{row_count} rows**")
 
-            # Display columns
-            col_data = []
-            for col in columns:
-                col_data.append(
-                    {
-                        "Column": col[1],
-                        "Type": col[2],
-                        "Nullable": "Yes" if not col[3] else "No",
-                    }
+            # Display columns (PRAGMA table_info: cid, name, type, notnull, ...)
+            info = np.array(columns, dtype=object).reshape(len(columns), -1)
+            df_cols = pd.DataFrame(
+                {
+                    "Column": info[:, 1],
+                    "Type": info[:, 2],
+                    "Nullable": np.where(info[:, 3] == 0, "Yes", "No"),
+                }
+            )
+
+            # Show one example row (truncated) next to the column types
+            if example_row:
+                example = pd.Series(example_row, dtype="object").astype("string")
+                example = example.where(
+                    example.str.len() <= 50, example.str[:50] + "..."
                 )
+                df_cols["Example"] = example.to_numpy()
 
-            df_cols = pd.DataFrame(col_data)
             st.dataframe(df_cols, hide_index=True, width="stretch")
 
-            # Show one example row (truncated)
-            try:
-                cursor.execute(f"SELECT * FROM {table} LIMIT 1")
-                example_row = cursor.fetchone()
-                if example_row:
-                    st.caption("**Example row (truncated):**")
-                    example_data = {}
-                    for i, col in enumerate(columns):
-                        value = example_row[i]
-                        if value and isinstance(value, str) and len(value) > 50:
-                            value = value[:50] + "..."
-                        example_data[col[1]] = value
-                    st.json(example_data, expanded=False)
-            except Exception:
-                pass
-
-
-def execute_query_with_viz(conn: Any, query: str, viz_type: str) -> None:
+
+def execute_query_with_viz(db: JobDatabase, query: str, viz_type: str) -> None:
     """Execute query and render with chosen visualization.
 
+    Results are cached for a few minutes per SQL text (see
+    fetch_query_results), so re-running a query is served from memory.
+
     Args:
-        conn: Database connection.
+        db: Database instance.
         query: SQL query string.
         viz_type: Visualization type.
     """
     try:
-        df = pd.read_sql_query(query, conn)
+        df = fetch_query_results(db, query)
 
         # Store result in session state
         st.session_state.last_result = (df, viz_type)
+        st.session_state.result_figures = {}
 
         if df.empty:
             st.warning("⚠️ Query returned no results")
@@ -368,17 +473,14 @@ def execute_query_with_viz(conn: Any, query: str, viz_type: str) -> None:
         )
 
         with st.expander("ℹ️ Data Structure"):
-            col_info = []
-            for col in df.columns:
-                dtype = df[col].dtype
-                col_info.append(
-                    {
-                        "Column": col,
-                        "Type": str(dtype),
-                        "Non-null": df[col].notna().sum(),
-                    }
-                )
-            st.dataframe(pd.DataFrame(col_info), hide_index=True)
+            col_info = pd.DataFrame(
+                {
+                    "Column": df.columns,
+                    "Type": df.dtypes.astype(str).to_numpy(),
+                    "Non-null": df.count().to_numpy(),
+                }
+            )
+            st.dataframe(col_info, hide_index=True)
 
         # Validate and render
         render_visualization(df, viz_type)
@@ -415,24 +517,138 @@ def render_visualization(df: pd.DataFrame, viz_type: str) -> None:
         validate_and_render_metric(df)
 
 
+def arrow_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Get a query result with Arrow-backed dtypes for st.dataframe.
+
+    st.dataframe serializes to Arrow, so converting once per result saves
+    the per-render inference of object columns. The conversion of the
+    current result is kept in session state; plotting keeps using df.
+
+    Args:
+        df: Query result.
+
+    Returns:
+        df converted with convert_dtypes(dtype_backend="pyarrow").
+    """
+    cached = st.session_state.get("result_arrow")
+    if cached is None or cached[0] is not df:
+        cached = (df, df.convert_dtypes(dtype_backend="pyarrow"))
+        st.session_state.result_arrow = cached
+    return cached[1]
+
+
 def render_table(df: pd.DataFrame) -> None:
     """Render as table (always works).
 
     Args:
         df: DataFrame to display.
     """
-    st.dataframe(df, width="stretch", height=500)
+    st.dataframe(arrow_frame(df), width="stretch", height=500)
 
-    # Export button
-    csv = df.to_csv(index=False)
+    # Export button; the CSV is only generated when the button is clicked
     st.download_button(
         "📥 Download CSV",
-        data=csv,
+        data=lambda: df.to_csv(index=False),
         file_name=f"query_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
         mime="text/csv",
     )
 
 
+def is_numeric_column(df: pd.DataFrame, position: int) -> bool:
+    """Check whether a column holds numbers, without slicing the frame.
+
+    Args:
+        df: DataFrame to check.
+        position: Column position.
+
+    Returns:
+        True if the column's dtype is numeric.
+    """
+    return df.dtypes.iloc[position].kind in NUMERIC_KINDS
+
+
+def truncate_categories(
+    df: pd.DataFrame, max_categories: int = MAX_CHART_CATEGORIES
+) -> pd.DataFrame:
+    """Keep the largest categories and group the rest as "Other".
+
+    Args:
+        df: DataFrame with category and numeric value as its first 2 columns.
+        max_categories: Number of categories to keep.
+
+    Returns:
+        The category and value columns of the top rows (in their original
+        order), followed by an "Other" row with the sum of the remaining
+        values.
+    """
+    values = df.iloc[:, 1]
+    keep = sorted(values.nlargest(max_categories).index)
+    top = df.iloc[:, :2].loc[keep]
+    other = pd.DataFrame([["Other", values.drop(keep).sum()]], columns=top.columns)
+    return pd.concat([top, other], ignore_index=True)
+
+
+def cached_figure(key: str, build: Callable[[], go.Figure]) -> go.Figure:
+    """Get a chart figure for the current query result, building it once.
+
+    Reruns that redisplay the last result (e.g. opening an expander) reuse
+    the figure instead of rebuilding it. The cache is cleared whenever a
+    query is executed.
+
+    Args:
+        key: Chart kind, e.g. "pie" or "bar_h".
+        build: Builds the figure on a cache miss.
+
+    Returns:
+        The figure.
+    """
+    figures = st.session_state.setdefault("result_figures", {})
+    if key not in figures:
+        figures[key] = build()
+    return figures[key]
+
+
+def build_bar_figure(df: pd.DataFrame, orientation: str = "v") -> go.Figure:
+    """Build a bar chart, grouping categories beyond the top ones as "Other".
+
+    Args:
+        df: DataFrame with category and numeric value as its first 2 columns.
+        orientation: 'v' for vertical, 'h' for horizontal.
+
+    Returns:
+        The figure.
+    """
+    if len(df) > MAX_CHART_CATEGORIES:
+        df = truncate_categories(df)
+
+    if orientation == "h":
+        fig = px.bar(df, x=df.columns[1], y=df.columns[0], orientation="h")
+        fig.update_layout(height=max(400, len(df) * 25))
+    else:
+        fig = px.bar(df, x=df.columns[0], y=df.columns[1])
+        fig.update_layout(height=500)
+    return fig
+
+
+def build_pie_figure(df: pd.DataFrame) -> go.Figure:
+    """Build a pie chart, grouping categories beyond the top ones as "Other".
+
+    Args:
+        df: DataFrame with category and numeric value columns.
+
+    Returns:
+        The figure.
+    """
+    if len(df) > MAX_CHART_CATEGORIES:
+        df = truncate_categories(df)
+
+    fig = px.pie(df, values=df.columns[1], names=df.columns[0], hole=0.4)
+    # Percentages inside the slices avoid outside-label collision handling
+    fig.update_traces(textposition="inside", textinfo="percent")
+    fig.update_layout(height=500)
+    return fig
+
+
 def validate_and_render_bar(df: pd.DataFrame, orientation: str = "v") -> None:
     """Validate and render bar chart.
 
@@ -451,33 +667,28 @@ def validate_and_render_bar(df: pd.DataFrame, orientation: str = "v") -> None:
         return
 
     # Check if second column is numeric
-    if not pd.api.types.is_numeric_dtype(df.iloc[:, 1]):
+    if not is_numeric_column(df, 1):
         st.error(
             f"❌ Bar chart needs numeric values in the second column. Column '{df.columns[1]}' contains {df.iloc[:, 1].dtype}."
         )
         st.info("💡 Use COUNT(*), SUM(), AVG(), etc. to create numeric values")
         return
 
-    # Warn if too many rows
-    if len(df) > 50:
-        st.warning(
-            f"⚠️ Chart has {len(df)} bars. Consider using LIMIT or grouping for better readability."
+    if len(df) > MAX_CHART_CATEGORIES:
+        st.info(
+            f"ℹ️ Showing the top {MAX_CHART_CATEGORIES} of {len(df)} bars; the rest are grouped as 'Other'."
         )
 
     # Render
     try:
-        if orientation == "h":
-            fig = px.bar(df, x=df.columns[1], y=df.columns[0], orientation="h")
-            fig.update_layout(height=max(400, len(df) * 25))
-        else:
-            fig = px.bar(df, x=df.columns[0], y=df.columns[1])
-            fig.update_layout(height=500)
-
+        fig = cached_figure(
+            f"bar_{orientation}", lambda: build_bar_figure(df, orientation)
+        )
         st.plotly_chart(fig, width="stretch")
 
         # Show raw data option
         with st.expander("📋 View Raw Data"):
-            st.dataframe(df, width="stretch")
+            st.dataframe(arrow_frame(df), width="stretch")
 
     except Exception as e:
         st.error(f"❌ Error rendering chart: {e}")
@@ -500,14 +711,14 @@ def validate_and_render_pie(df: pd.DataFrame) -> None:
         return
 
     # Check if second column is numeric
-    if not pd.api.types.is_numeric_dtype(df.iloc[:, 1]):
+    if not is_numeric_column(df, 1):
         st.error(
             f"❌ Pie chart needs numeric values. Column '{df.columns[1]}' contains {df.iloc[:, 1].dtype}."
         )
         return
 
     # Check for negative values
-    if (df.iloc[:, 1] < 0).any():
+    if (df.iloc[:, 1].to_numpy(dtype=float, na_value=np.nan) < 0).any():
         st.error("❌ Pie chart cannot display negative values.")
         return
 
@@ -521,19 +732,131 @@ def validate_and_render_pie(df: pd.DataFrame) -> None:
         st.error("❌ Pie chart needs at least 2 categories.")
         return
 
+    if len(df) > MAX_CHART_CATEGORIES:
+        st.info(
+            f"ℹ️ Showing the top {MAX_CHART_CATEGORIES} of {len(df)} slices; the rest are grouped as 'Other'."
+        )
+
     # Render
     try:
-        fig = px.pie(df, values=df.columns[1], names=df.columns[0], hole=0.4)
-        fig.update_layout(height=500)
+        fig = cached_figure("pie", lambda: build_pie_figure(df))
         st.plotly_chart(fig, width="stretch")
 
         with st.expander("📋 View Raw Data"):
-            st.dataframe(df, width="stretch")
+            st.dataframe(arrow_frame(df), width="stretch")
 
     except Exception as e:
         st.error(f"❌ Error rendering chart: {e}")
 
 
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Select points with Largest-Triangle-Three-Buckets downsampling.
+
+    The first and last points are kept; every bucket in between contributes
+    the point forming the largest triangle with the previously selected
+    point and the average of the next bucket, which preserves the shape of
+    the series.
+
+    Args:
+        x: X values (increasing).
+        y: Y values.
+        threshold: Number of points to keep.
+
+    Returns:
+        Sorted positions of the selected points.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    bucket_size = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    selected = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(area.argmax())
+        indices[i + 1] = selected
+
+    return indices
+
+
+def downsample_line(
+    df: pd.DataFrame, max_points: int = LINE_MAX_POINTS
+) -> pd.DataFrame:
+    """Downsample line chart data, keeping its visual shape.
+
+    Points are chosen on the first y column (second column) and the same rows
+    are kept for every other column. Non-numeric x values (e.g. dates) are
+    taken in row order.
+
+    Args:
+        df: DataFrame with x-axis as its first column and numeric y columns.
+        max_points: Number of rows to keep.
+
+    Returns:
+        The selected rows of df.
+    """
+    x_col = df.iloc[:, 0]
+    if pd.api.types.is_numeric_dtype(x_col):
+        x = x_col.to_numpy(dtype=float, na_value=np.nan)
+    else:
+        x = np.arange(len(df), dtype=float)
+    y = np.nan_to_num(df.iloc[:, 1].to_numpy(dtype=float, na_value=np.nan))
+    return df.iloc[lttb_indices(x, y, max_points)]
+
+
+def build_line_figure(df: pd.DataFrame) -> go.Figure:
+    """Build a line chart with one line per numeric column after the first.
+
+    Long series are downsampled and large ones drawn with WebGL.
+
+    Args:
+        df: DataFrame with x-axis as its first column.
+
+    Returns:
+        The figure.
+    """
+    if len(df) > LINE_MAX_POINTS:
+        df = downsample_line(df)
+
+    use_webgl = len(df) > WEBGL_MIN_POINTS
+    fig = px.line(
+        df,
+        x=df.columns[0],
+        y=df.columns[1],
+        markers=True,
+        render_mode="webgl" if use_webgl else "svg",
+    )
+
+    # Add more lines if more columns
+    scatter = go.Scattergl if use_webgl else go.Scatter
+    for position in range(2, len(df.columns)):
+        if is_numeric_column(df, position):
+            fig.add_trace(
+                scatter(
+                    x=df.iloc[:, 0],
+                    y=df.iloc[:, position],
+                    mode="lines+markers",
+                    name=df.columns[position],
+                )
+            )
+
+    fig.update_layout(height=500)
+    return fig
+
+
 def validate_and_render_line(df: pd.DataFrame) -> None:
     """Validate and render line chart.
 
@@ -556,28 +879,24 @@ def validate_and_render_line(df: pd.DataFrame) -> None:
         return
 
     # Check if y-axis is numeric
-    if not pd.api.types.is_numeric_dtype(df.iloc[:, 1]):
+    if not is_numeric_column(df, 1):
         st.error(
             f"❌ Line chart needs numeric values for y-axis. Column '{df.columns[1]}' contains {df.iloc[:, 1].dtype}."
         )
         return
 
+    if len(df) > LINE_MAX_POINTS:
+        st.info(
+            f"ℹ️ Showing {LINE_MAX_POINTS} of {len(df)} points (downsampled, shape preserved)."
+        )
+
     # Render
     try:
-        fig = px.line(df, x=df.columns[0], y=df.columns[1], markers=True)
-
-        # Add more lines if more columns
-        for col in df.columns[2:]:
-            if pd.api.types.is_numeric_dtype(df[col]):
-                fig.add_scatter(
-                    x=df[df.columns[0]], y=df[col], mode="lines+markers", name=col
-                )
-
-        fig.update_layout(height=500)
+        fig = cached_figure("line", lambda: build_line_figure(df))
         st.plotly_chart(fig, width="stretch")
 
         with st.expander("📋 View Raw Data"):
-            st.dataframe(df, width="stretch")
+            st.dataframe(arrow_frame(df), width="stretch")
 
     except Exception as e:
         st.error(f"❌ Error rendering chart: {e}")
@@ -616,23 +935,23 @@ def validate_and_render_metric(df: pd.DataFrame) -> None:
         # If multiple rows with 2 columns, show label + value
         elif len(df.columns) >= 2:
             cols = st.columns(min(len(df), 4))
-            for i, row in df.iterrows():
+            labels = df.iloc[:, 0].astype(str).to_numpy()
+            values = df.iloc[:, 1].to_numpy()
+            for i, (label, value) in enumerate(zip(labels, values)):
                 with cols[i]:
-                    label = str(row.iloc[0])
-                    value = row.iloc[1]
                     st.metric(label, value)
 
         # If single column, show each row as a metric
         else:
             cols = st.columns(min(len(df), 4))
-            for i, row in df.iterrows():
+            for i, value in enumerate(df.iloc[:, 0].to_numpy()):
                 with cols[i]:
-                    st.metric(f"Value {i + 1}", row.iloc[0])
+                    st.metric(f"Value {i + 1}", value)
 
         st.divider()
 
         with st.expander("📋 View Raw Data"):
-            st.dataframe(df, width="stretch")
+            st.dataframe(arrow_frame(df), width="stretch")
 
     except Exception as e:
         st.error(f"❌ Error rendering metrics: {e}")
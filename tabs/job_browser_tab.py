@@ -2,9 +2,14 @@
 
 import datetime
 import logging
+import os
+from collections.abc import Iterable
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 
 import constants
@@ -13,33 +18,600 @@ from modules.interview_stages_loader import (
     get_stage_options,
     format_stage_option,
 )
-from tabs.job_edit_panel import render_edit_panel
+from tabs.job_edit_panel import refresh_edit_data, render_edit_panel
 from tabs.add_job_panel import render_add_job_panel
 
 logger = logging.getLogger(__name__)
 
+# Emoji shown next to each job site (anything else gets 🌐)
+SITE_EMOJI = {
+    "indeed": "📄",
+    "linkedin": "💼",
+    "glassdoor": "🏢",
+    "zip_recruiter": "📨",
+    "other": "📝",
+}
+
+# Interview stage choices and their labels, built once at import
+STAGE_OPTIONS = tuple(get_stage_options())
+STAGE_LABELS = {stage: format_stage_option(stage) for stage in STAGE_OPTIONS}
+
+# Job fields the jobs view is built from (see build_jobs_view)
+VIEW_FIELDS = (
+    "id",
+    "llm_score",
+    "site",
+    "title",
+    "company",
+    "location",
+    "application_date",
+    "date_scraped",
+    "min_amount",
+    "max_amount",
+    "currency",
+    "interval",
+)
+
+# Columns of the jobs view shown in the selection table
+TABLE_COLUMNS = ["score", "site", "title", "company", "location", "applied"]
+
+
+def format_amounts(amounts: pd.Series) -> pd.Series:
+    """Format salary amounts with thousands separators and no decimals."""
+    # astype keeps the result a string series even when no amounts are given
+    return amounts.map("{:,.0f}".format).astype(str)
+
+
+@st.cache_data(show_spinner=False)
+def build_jobs_view(jobs_fingerprint: tuple[tuple[Any, ...], ...]) -> pd.DataFrame:
+    """Build the table and display strings for a page of jobs.
+
+    Args:
+        jobs_fingerprint: Values of VIEW_FIELDS for each job, in display
+            order. The result is cached until one of them changes.
+
+    Returns:
+        DataFrame with one row per job: the TABLE_COLUMNS, plus the
+        site_emoji, header (expander title without the selection marker),
+        scraped and salary display strings.
+    """
+    jobs = pd.DataFrame.from_records(
+        jobs_fingerprint, columns=VIEW_FIELDS, coerce_float=True
+    )
+    view = pd.DataFrame(
+        {
+            "score": jobs["llm_score"].fillna(0).astype(int),
+            "site": jobs["site"].fillna(""),
+            "title": jobs["title"],
+            "company": jobs["company"],
+            "location": jobs["location"],
+            "applied": jobs["application_date"].fillna("").astype(bool),
+        }
+    )
+    view["site_emoji"] = view["site"].str.lower().map(SITE_EMOJI).fillna("🌐")
+
+    applied_indicator = np.where(view["applied"], "✅ APPLIED", "")
+    view["header"] = (
+        view["score"].astype(str)
+        + "/10 "
+        + view["site_emoji"]
+        + " - "
+        + jobs["title"].fillna("None")
+        + " @ "
+        + jobs["company"].fillna("None")
+        + " - "
+        + jobs["location"].fillna("None")
+        + " "
+        + applied_indicator
+    )
+
+    date_scraped = jobs["date_scraped"].fillna("")
+    view["scraped"] = date_scraped.str.slice(0, 10).where(date_scraped != "", "Unknown")
+
+    # Zero amounts count as missing. Most jobs have no salary at all, so only
+    # the rows that do get formatted
+    min_amount = jobs["min_amount"].fillna(0).astype(float)
+    max_amount = jobs["max_amount"].fillna(0).astype(float)
+    has_min = min_amount != 0
+    has_max = max_amount != 0
+    has_any = has_min | has_max
+    view["salary"] = ""
+    if has_any.any():
+        min_text = format_amounts(min_amount[has_min])
+        max_text = format_amounts(max_amount[has_max])
+        # Aligning on the index leaves NaN wherever one side is missing
+        salary = (
+            (min_text + " - " + max_text)
+            .combine_first("From " + min_text)
+            .combine_first("Up to " + max_text)
+        )
+        currency = jobs["currency"].fillna("")[has_any]
+        interval = jobs["interval"].fillna("").replace("", "N/A")[has_any]
+        view.loc[has_any, "salary"] = salary + " " + currency + " (" + interval + ")"
+
+    return view
+
 
-def get_resume_version_pdf() -> list[str]:
+@st.cache_data(ttl=60, show_spinner=False)
+def list_resume_pdfs(folder: str, folder_mtime: float) -> tuple[str, ...]:
+    """List the PDF files in a resume folder.
+
+    Args:
+        folder: Folder to scan.
+        folder_mtime: Modification time of the folder. Adding, removing or
+            renaming a file changes it, which invalidates the cached listing.
+
+    Returns:
+        PDF filenames sorted alphabetically.
+    """
+    with os.scandir(folder) as entries:
+        return tuple(
+            sorted(
+                entry.name
+                for entry in entries
+                if entry.is_file() and entry.name.lower().endswith(".pdf")
+            )
+        )
+
+
+def get_resume_version_pdf() -> tuple[str, ...]:
     """Get list of resume PDF files from RESUME_FINAL_DIR folder.
 
     Returns:
-        List of PDF filenames sorted alphabetically.
+        PDF filenames sorted alphabetically.
     """
     resume_folder = Path(constants.RESUME_FINAL_DIR)
     if not resume_folder.exists():
         resume_folder.mkdir(parents=True)
-        return []
+        return ()
+
+    return list_resume_pdfs(str(resume_folder), resume_folder.stat().st_mtime)
+
+
+def resume_file_exists(resume_path: Path, resume_pdfs: frozenset[str]) -> bool:
+    """Check whether an application's resume file still exists.
+
+    Args:
+        resume_path: Resume file recorded on the application.
+        resume_pdfs: Names of the PDFs currently in RESUME_FINAL_DIR.
+
+    Returns:
+        True if the file exists. Resumes from RESUME_FINAL_DIR are looked up
+        in resume_pdfs; any other path is checked on disk.
+    """
+    if (
+        resume_path.parent == Path(constants.RESUME_FINAL_DIR)
+        and resume_path.suffix.lower() == ".pdf"
+    ):
+        return resume_path.name in resume_pdfs
+    return resume_path.exists()
+
+
+def apply_selection_edits(editor_key: str, job_ids: tuple[int, ...]) -> None:
+    """Apply checkbox edits from the jobs table to the selected jobs.
+
+    Args:
+        editor_key: Widget key of the jobs table.
+        job_ids: Job ID of each table row, in display order.
+    """
+    for position, changes in st.session_state[editor_key]["edited_rows"].items():
+        if "select" not in changes:
+            continue
+        job_id = job_ids[int(position)]
+        if changes["select"]:
+            st.session_state.selected_jobs.add(job_id)
+        else:
+            st.session_state.selected_jobs.discard(job_id)
+
+    # Reset confirmation state when changing selection
+    st.session_state.confirm_delete = False
+    # Start a fresh table so it is rebuilt from selected_jobs
+    st.session_state.jobs_editor_version += 1
+
+
+def go_to_page(page: int) -> None:
+    """Switch the job browser to another page.
+
+    Args:
+        page: Page number to show.
+    """
+    st.session_state.current_page = page
+
+
+def sync_page_input() -> None:
+    """Switch to the page typed into the page number input."""
+    st.session_state.current_page = st.session_state.page_input
+
+
+def start_adding_job() -> None:
+    """Open the manual add job panel."""
+    st.session_state.adding_job = True
+
+
+def refresh_jobs(message: str = "") -> None:
+    """Rerun the whole app after a job row changed the jobs.
+
+    Row widgets live in fragments, whose callbacks can't display elements
+    or rerun the app, so render_job_row does both on its next run.
+
+    Args:
+        message: Toast to show, if any.
+    """
+    st.session_state.jobs_changed = message
+
+
+def start_editing_job(job_id: int) -> None:
+    """Open the edit panel for a job.
+
+    Args:
+        job_id: ID of the job to edit.
+    """
+    st.session_state.editing_job_id = job_id
+    # The job may have changed since the panel last cached it
+    refresh_edit_data()
+    refresh_jobs()
+
+
+def select_jobs(job_ids: Iterable[int]) -> None:
+    """Replace the selected jobs.
+
+    Args:
+        job_ids: IDs of the jobs to select.
+    """
+    st.session_state.selected_jobs = set(job_ids)
+    st.session_state.confirm_delete = False
+
+
+def select_filtered_jobs(db: JobDatabase, filters: dict[str, Any]) -> None:
+    """Select every job matching the filters, not just the current page.
+
+    Args:
+        db: Database instance.
+        filters: Filters the jobs were fetched with.
+    """
+    select_jobs(db.get_filtered_ids(filters))
+
+
+def set_confirm_delete(confirm: bool) -> None:
+    """Show or hide the bulk delete confirmation.
+
+    Args:
+        confirm: Whether to ask for confirmation.
+    """
+    st.session_state.confirm_delete = confirm
+    if not confirm:
+        st.toast("Deletion cancelled")
+
+
+def archive_selected_jobs(db: JobDatabase) -> None:
+    """Archive every selected job.
+
+    Args:
+        db: Database instance.
+    """
+    try:
+        archived = db.archive_jobs(st.session_state.selected_jobs)
+        st.toast(f"✓ Archived {archived} job(s)")
+        st.session_state.selected_jobs = set()
+    except Exception as e:
+        # Shown under the Archive button on the rerun
+        st.session_state.bulk_archive_error = f"Error archiving jobs: {e}"
+
+
+def delete_selected_jobs(db: JobDatabase) -> None:
+    """Delete every selected job with its applications and stages.
+
+    Args:
+        db: Database instance.
+    """
+    try:
+        deleted_jobs, deleted_apps, deleted_stages = db.delete_jobs(
+            st.session_state.selected_jobs
+        )
+
+        st.toast(
+            f"✓ Deleted {deleted_jobs} jobs, {deleted_apps} applications, {deleted_stages} interview stages"
+        )
+
+        # Reset state
+        st.session_state.selected_jobs = set()
+        st.session_state.confirm_delete = False
 
-    resume_files = list(resume_folder.glob("*.*"))
-    # Only show PDF files
-    valid_extensions = {".pdf"}
-    resume_files = [f for f in resume_files if f.suffix.lower() in valid_extensions]
+    except Exception as e:
+        # Shown under the delete confirmation on the rerun
+        st.session_state.bulk_delete_error = f"Error deleting jobs: {e}"
 
-    return sorted([f.name for f in resume_files])
+
+def toggle_archived(db: JobDatabase, job_id: int, is_archived: bool) -> None:
+    """Archive or unarchive a single job.
+
+    Args:
+        db: Database instance.
+        job_id: ID of the job.
+        is_archived: Whether the job is currently archived.
+    """
+    if is_archived:
+        db.unarchive_job(job_id)
+        refresh_jobs("Unarchived!")
+    else:
+        db.archive_job(job_id)
+        st.session_state.selected_jobs.discard(job_id)
+        refresh_jobs("Archived!")
+
+
+def delete_job(db: JobDatabase, job_id: int) -> None:
+    """Delete a single job with its applications and stages.
+
+    Args:
+        db: Database instance.
+        job_id: ID of the job.
+    """
+    db.delete_jobs([job_id])
+    st.session_state.selected_jobs.discard(job_id)
+    refresh_jobs("Deleted!")
+
+
+def add_stage(db: JobDatabase, job_id: int) -> None:
+    """Add the interview stage entered in a job's stage form.
+
+    Args:
+        db: Database instance.
+        job_id: ID of the job.
+    """
+    new_stage = st.session_state[f"stage_select_{job_id}"]
+    if new_stage:
+        # Convert date to string format for database
+        date_str = st.session_state[f"stage_date_{job_id}"].strftime("%Y-%m-%d")
+        db.add_interview_stage(
+            job_id, new_stage, st.session_state[f"stage_notes_{job_id}"], date_str
+        )
+        refresh_jobs("Stage added!")
+
+
+def mark_job_applied(db: JobDatabase, job_id: int) -> None:
+    """Record the application entered in a job's apply form.
+
+    Args:
+        db: Database instance.
+        job_id: ID of the job.
+    """
+    selected_resume = st.session_state.get(f"resume_select_{job_id}")
+    if selected_resume:
+        # Convert date to string format for database
+        date_str = st.session_state[f"date_{job_id}"].strftime("%Y-%m-%d")
+        db.mark_applied(
+            job_id,
+            # Version is the filename without extension
+            Path(selected_resume).stem,
+            str(Path(constants.RESUME_FINAL_DIR) / selected_resume),
+            st.session_state[f"cover_{job_id}"],
+            st.session_state[f"notes_{job_id}"],
+            date_str,
+        )
+        refresh_jobs("Marked as applied!")
+
+
+def render_job_details(
+    db: JobDatabase,
+    job: dict[str, Any],
+    display: Any,
+    available_resumes: tuple[str, ...],
+    existing_resumes: frozenset[str],
+) -> None:
+    """Render the details, application forms and actions of one job.
+
+    Args:
+        db: Database instance.
+        job: Job dictionary.
+        display: The job's row of build_jobs_view.
+        available_resumes: PDF filenames in RESUME_FINAL_DIR.
+        existing_resumes: Same names as a set, for existence checks.
+    """
+
+    col1, col2, col3 = st.columns([2, 1, 0.3])
+
+    with col1:
+        # One markdown element for all the plain fields instead of one each
+        details = [
+            f"**ID:** {job['id']}",
+            f"**Site:** {display.site_emoji} {(job.get('site') or 'Unknown').title()}",
+            f"**Posted:** {job['date_posted'] or 'Unknown'}",
+            f"**Scraped:** {display.scraped}",
+            f"**Type:** {job['job_type'] or 'N/A'}",
+        ]
+
+        # URLs
+        if job["job_url"]:
+            details.append(f"**URL:** [{job['job_url']}]({job['job_url']})")
+        if job["job_url_direct"]:
+            details.append(
+                f"**Direct:** [{job['job_url_direct']}]({job['job_url_direct']})"
+            )
+
+        # Salary info if available
+        if display.salary:
+            details.append(f"**Salary:** {display.salary}")
+
+        details.append("**LLM Reasoning:**")
+        details.append(job["llm_reasoning"] or "N/A")
+        st.markdown("\n\n".join(details))
+
+        # Show warning if description is missing
+        if not job.get("description") or len(job.get("description", "")) < 50:
+            st.warning("⚠️ Description missing or incomplete")
+
+        with st.expander("📄 Full Description"):
+            st.markdown(job["description"] or "No description available")
+
+        # Company info if available
+        if job.get("company_description"):
+            with st.expander("🏢 Company Info"):
+                if job.get("company_logo"):
+                    st.image(job["company_logo"], width=100)
+                st.write(job["company_description"])
+                if job.get("company_revenue"):
+                    st.write(f"**Revenue:** {job['company_revenue']}")
+                if job.get("company_num_employees"):
+                    st.write(f"**Employees:** {job['company_num_employees']}")
+
+    with col2:
+        st.write("### Application")
+
+        if job.get("application_date"):
+            st.success(f"✅ Applied on {job['application_date'][:10]}")
+            application = [f"**Resume:** {job.get('resume_version')}"]
+            if job.get("resume_file_path"):
+                resume_path = Path(job["resume_file_path"])
+                if resume_file_exists(resume_path, existing_resumes):
+                    application.append(f"**File:** ✓ {resume_path.name}")
+                else:
+                    application.append(f"**File:** ⚠️ {resume_path.name} (not found)")
+
+            # Interview stages
+            if job.get("stages"):
+                application.append("**Stages:**")
+                application.append(
+                    "\n".join(f"- {stage}" for stage in job["stages"].split(","))
+                )
+            st.markdown("\n\n".join(application))
+
+            # Add new stage
+            with st.form(f"stage_{job['id']}"):
+                st.write("**Add Interview Stage**")
+                st.selectbox(
+                    "Stage",
+                    STAGE_OPTIONS,
+                    format_func=STAGE_LABELS.__getitem__,
+                    key=f"stage_select_{job['id']}",
+                )
+                st.text_area("Notes", key=f"stage_notes_{job['id']}")
+                # Stage date picker
+                st.date_input(
+                    "Stage Date",
+                    value=datetime.date.today(),
+                    key=f"stage_date_{job['id']}",
+                )
+                st.form_submit_button(
+                    "Add Stage", on_click=add_stage, args=(db, job["id"])
+                )
+        else:
+            # Mark as applied - with resume file picker
+            with st.form(f"apply_{job['id']}"):
+                st.write("**Mark as Applied**")
+
+                if available_resumes:
+                    st.selectbox(
+                        "Select Resume",
+                        options=available_resumes,
+                        key=f"resume_select_{job['id']}",
+                    )
+                    # The full path is only built on submit (mark_job_applied);
+                    # inside a form the selection wouldn't update it anyway
+                    st.caption(f"📁 From `{constants.RESUME_FINAL_DIR}`")
+
+                else:
+                    st.warning("⚠️ No resumes found in 'Resumes' folder")
+                    st.info("Please add resume files to the 'Resumes' folder")
+
+                # Optional: Cover letter
+                st.text_input("Cover Letter (optional)", key=f"cover_{job['id']}")
+
+                # Notes
+                st.text_area("Application Notes", key=f"notes_{job['id']}")
+
+                # Application date picker
+                st.date_input(
+                    "Application Date",
+                    value=datetime.date.today(),
+                    key=f"date_{job['id']}",
+                )
+
+                # Submit button
+                submit_disabled = not available_resumes
+                st.form_submit_button(
+                    "Mark Applied",
+                    disabled=submit_disabled,
+                    on_click=mark_job_applied,
+                    args=(db, job["id"]),
+                )
+
+    with col3:
+        st.write("")
+        st.write("")
+        st.button(
+            "✏️",
+            key=f"edit_{job['id']}",
+            help="Edit this job",
+            on_click=start_editing_job,
+            args=(job["id"],),
+        )
+
+        is_archived = bool(job.get("archived", 0))
+        archive_label = "📤" if is_archived else "📦"
+        archive_help = "Unarchive this job" if is_archived else "Archive this job"
+        st.button(
+            archive_label,
+            key=f"archive_{job['id']}",
+            help=archive_help,
+            on_click=toggle_archived,
+            args=(db, job["id"], is_archived),
+        )
+
+        st.button(
+            "🗑️",
+            key=f"del_{job['id']}",
+            help="Delete this job",
+            on_click=delete_job,
+            args=(db, job["id"]),
+        )
+
+
+@st.fragment
+def render_job_row(
+    db: JobDatabase,
+    job: dict[str, Any],
+    display: Any,
+    available_resumes: tuple[str, ...],
+    existing_resumes: frozenset[str],
+) -> None:
+    """Render one job's expander.
+
+    Runs as a fragment, so opening or closing a job reruns only that job
+    instead of the whole dashboard. Actions that change the jobs call
+    refresh_jobs(), which escalates to a full rerun to refetch them.
+
+    Args:
+        db: Database instance.
+        job: Job dictionary.
+        display: The job's row of build_jobs_view.
+        available_resumes: PDF filenames in RESUME_FINAL_DIR.
+        existing_resumes: Same names as a set, for existence checks.
+    """
+    message = st.session_state.pop("jobs_changed", None)
+    if message is not None:
+        if message:
+            st.toast(message)
+        st.rerun()
+
+    # Show selection status in expander title
+    selection_emoji = "☑️" if job["id"] in st.session_state.selected_jobs else "⭐"
+
+    # Only an open expander runs its body, so collapsed jobs cost
+    # nothing beyond their title
+    with st.expander(
+        f"{selection_emoji} {display.header}",
+        key=f"details_{job['id']}",
+        on_change="rerun",
+    ) as details:
+        if details.open:
+            render_job_details(db, job, display, available_resumes, existing_resumes)
 
 
 def render_job_browser(
-    db: JobDatabase, jobs: list[dict[str, Any]], total_count: int
+    db: JobDatabase,
+    jobs: list[dict[str, Any]],
+    total_count: int,
+    filters: dict[str, Any],
 ) -> None:
     """Render the job browser tab.
 
@@ -47,12 +619,16 @@ def render_job_browser(
         db: Database instance.
         jobs: List of job dictionaries.
         total_count: Total number of jobs matching filters.
+        filters: Filters the jobs were fetched with.
     """
-
-    if "editing_job_id" not in st.session_state:
-        st.session_state.editing_job_id = None
-    if "adding_job" not in st.session_state:
-        st.session_state.adding_job = False
+    # The dashboard sets most of these too; don't rely on it
+    st.session_state.setdefault("editing_job_id", None)
+    st.session_state.setdefault("adding_job", False)
+    st.session_state.setdefault("jobs_editor_version", 0)
+    st.session_state.setdefault("selected_jobs", set())
+    st.session_state.setdefault("confirm_delete", False)
+    st.session_state.setdefault("current_page", 1)
+    st.session_state.setdefault("page_size", 20)
 
     st.title("🎯 Job Application Tracker")
 
@@ -70,9 +646,12 @@ def render_job_browser(
     # Add Job button at the top
     col_add, col_pagination = st.columns([1, 4])
     with col_add:
-        if st.button("➕ Add Job Manually", type="primary", use_container_width=True):
-            st.session_state.adding_job = True
-            st.rerun()
+        st.button(
+            "➕ Add Job Manually",
+            type="primary",
+            use_container_width=True,
+            on_click=start_adding_job,
+        )
 
     # Pagination controls
     st.subheader("📄 Pagination")
@@ -80,20 +659,28 @@ def render_job_browser(
         1, (total_count + st.session_state.page_size - 1) // st.session_state.page_size
     )
     if st.session_state.current_page > total_pages:
+        # The jobs were fetched for a page that no longer exists
         st.session_state.current_page = 1
         st.rerun()
 
+    current_page = st.session_state.current_page
     col1, col2, col3, col4, col5 = st.columns([1, 1, 1.4, 1, 1])
 
     with col1:
-        if st.button("⏮️ First", disabled=st.session_state.current_page == 1):
-            st.session_state.current_page = 1
-            st.rerun()
+        st.button(
+            "⏮️ First",
+            disabled=current_page == 1,
+            on_click=go_to_page,
+            args=(1,),
+        )
 
     with col2:
-        if st.button("◀️ Previous", disabled=st.session_state.current_page == 1):
-            st.session_state.current_page -= 1
-            st.rerun()
+        st.button(
+            "◀️ Previous",
+            disabled=current_page == 1,
+            on_click=go_to_page,
+            args=(current_page - 1,),
+        )
 
     with col3:
         page_label_col, page_input_col, page_total_col = st.columns([0.8, 1, 0.9])
@@ -103,57 +690,72 @@ def render_job_browser(
                 unsafe_allow_html=True,
             )
         with page_input_col:
-            selected_page = st.number_input(
+            # Keep the input in step with the page buttons
+            if st.session_state.get("page_input") != current_page:
+                st.session_state.page_input = current_page
+            st.number_input(
                 "Page",
                 min_value=1,
                 max_value=total_pages,
-                value=st.session_state.current_page,
                 step=1,
                 label_visibility="collapsed",
+                key="page_input",
+                on_change=sync_page_input,
             )
         with page_total_col:
             st.markdown(
                 f"<div style='padding-top: 0.45rem; font-weight: 700;'>of {total_pages}</div>",
                 unsafe_allow_html=True,
             )
-        if selected_page != st.session_state.current_page:
-            st.session_state.current_page = selected_page
-            st.rerun()
 
     with col4:
-        if st.button("Next ▶️", disabled=st.session_state.current_page == total_pages):
-            st.session_state.current_page += 1
-            st.rerun()
+        st.button(
+            "Next ▶️",
+            disabled=current_page == total_pages,
+            on_click=go_to_page,
+            args=(current_page + 1,),
+        )
 
     with col5:
-        if st.button("Last ⏭️", disabled=st.session_state.current_page == total_pages):
-            st.session_state.current_page = total_pages
-            st.rerun()
+        st.button(
+            "Last ⏭️",
+            disabled=current_page == total_pages,
+            on_click=go_to_page,
+            args=(total_pages,),
+        )
 
     # Show job range
-    start_idx = (st.session_state.current_page - 1) * st.session_state.page_size + 1
+    start_idx = (current_page - 1) * st.session_state.page_size + 1
     end_idx = min(start_idx + len(jobs) - 1, total_count)
     st.caption(f"Showing jobs {start_idx}-{end_idx} of {total_count} total jobs")
 
     # Bulk selection and deletion/archiving
     if jobs:
+        job_ids = tuple(map(itemgetter("id"), jobs))
+        selected = st.session_state.selected_jobs
+        selected_count = len(selected)
+
         st.subheader("🗂️ Bulk Selection & Actions")
 
         col1, col2, col3, col4 = st.columns([1, 1, 1, 2])
 
         with col1:
-            if st.button("✅ Select All Filtered", width="stretch"):
-                st.session_state.selected_jobs = {j["id"] for j in jobs}
-                st.rerun()
+            st.button(
+                "✅ Select All Filtered",
+                width="stretch",
+                on_click=select_filtered_jobs,
+                args=(db, filters),
+            )
 
         with col2:
-            if st.button("❌ Deselect All", width="stretch"):
-                st.session_state.selected_jobs = set()
-                st.session_state.confirm_delete = False
-                st.rerun()
+            st.button(
+                "❌ Deselect All",
+                width="stretch",
+                on_click=select_jobs,
+                args=((),),
+            )
 
         with col3:
-            selected_count = len(st.session_state.selected_jobs)
             st.metric("Selected", selected_count)
 
         with col4:
@@ -161,37 +763,27 @@ def render_job_browser(
                 col_archive, col_delete = st.columns(2)
 
                 with col_archive:
-                    if st.button(
+                    st.button(
                         f"📦 Archive {selected_count}",
                         width="stretch",
                         key="bulk_archive",
-                    ):
-                        try:
-                            cursor = db.conn.cursor()
-                            job_ids = list(st.session_state.selected_jobs)
-                            placeholders = ",".join(["?" for _ in job_ids])
-                            cursor.execute(
-                                f"UPDATE jobs SET archived = 1 WHERE id IN ({placeholders})",
-                                job_ids,
-                            )
-                            db.conn.commit()
-                            st.toast(f"✓ Archived {selected_count} job(s)")
-                            st.session_state.selected_jobs = set()
-                            st.rerun()
-                        except Exception as e:
-                            st.error(f"Error archiving jobs: {e}")
+                        on_click=archive_selected_jobs,
+                        args=(db,),
+                    )
+                    if error := st.session_state.pop("bulk_archive_error", None):
+                        st.error(error)
 
                 with col_delete:
                     # Show delete button
                     if not st.session_state.confirm_delete:
-                        if st.button(
+                        st.button(
                             f"🗑️ Delete {selected_count}",
                             type="primary",
                             width="stretch",
                             key="show_confirm",
-                        ):
-                            st.session_state.confirm_delete = True
-                            st.rerun()
+                            on_click=set_confirm_delete,
+                            args=(True,),
+                        )
 
         # Show confirmation dialog if triggered
         if st.session_state.confirm_delete and selected_count > 0:
@@ -202,331 +794,65 @@ def render_job_browser(
             col_a, col_b, col_c = st.columns([1, 1, 2])
 
             with col_a:
-                if st.button("✓ YES, DELETE", type="primary", key="do_delete"):
-                    try:
-                        cursor = db.conn.cursor()
-                        job_ids = list(st.session_state.selected_jobs)
-
-                        # Delete related records first (applications and interview stages)
-                        placeholders = ",".join(["?" for _ in job_ids])
-
-                        cursor.execute(
-                            f"DELETE FROM applications WHERE job_id IN ({placeholders})",
-                            job_ids,
-                        )
-                        deleted_apps = cursor.rowcount
-
-                        cursor.execute(
-                            f"DELETE FROM interview_stages WHERE job_id IN ({placeholders})",
-                            job_ids,
-                        )
-                        deleted_stages = cursor.rowcount
-
-                        cursor.execute(
-                            f"DELETE FROM jobs WHERE id IN ({placeholders})", job_ids
-                        )
-                        deleted_jobs = cursor.rowcount
-
-                        db.conn.commit()
-
-                        st.toast(
-                            f"✓ Deleted {deleted_jobs} jobs, {deleted_apps} applications, {deleted_stages} interview stages"
-                        )
-
-                        # Reset state
-                        st.session_state.selected_jobs = set()
-                        st.session_state.confirm_delete = False
-                        st.rerun()
-
-                    except Exception as e:
-                        st.error(f"Error deleting jobs: {e}")
+                st.button(
+                    "✓ YES, DELETE",
+                    type="primary",
+                    key="do_delete",
+                    on_click=delete_selected_jobs,
+                    args=(db,),
+                )
+                if error := st.session_state.pop("bulk_delete_error", None):
+                    st.error(error)
 
             with col_b:
-                if st.button("✗ CANCEL", key="cancel_delete"):
-                    st.session_state.confirm_delete = False
-                    st.toast("Deletion cancelled")
-                    st.rerun()
+                st.button(
+                    "✗ CANCEL",
+                    key="cancel_delete",
+                    on_click=set_confirm_delete,
+                    args=(False,),
+                )
 
         # Jobs table
         st.subheader("📋 Jobs")
 
         st.info(
-            "💡 Tip: Use filters above to narrow down jobs, then click 'Select All Filtered'. Click checkbox buttons to toggle individual selections."
+            "💡 Tip: Use filters above to narrow down jobs, then click 'Select All Filtered'. Tick the boxes in the table to toggle individual selections."
         )
 
-        for idx, job in enumerate(jobs):
-            is_selected = job["id"] in st.session_state.selected_jobs
-
-            # Use button-style selection
-            selection_emoji = "☑️" if is_selected else "⭐"
-            score_display = job["llm_score"] or 0
-
-            # Site emoji
-            site_emoji = {
-                "indeed": "📄",
-                "linkedin": "💼",
-                "glassdoor": "🏢",
-                "zip_recruiter": "📨",
-                "other": "📝",
-            }.get(job.get("site", "").lower(), "🌐")
-
-            # Create clickable header for selection
-            col_select, col_content = st.columns([0.05, 0.95])
-
-            with col_select:
-                # Clickable button to toggle selection
-                button_label = "☑️" if is_selected else "☐"
-                if st.button(
-                    button_label,
-                    key=f"toggle_{job['id']}",
-                    help="Click to select/deselect",
-                ):
-                    if is_selected:
-                        st.session_state.selected_jobs.discard(job["id"])
-                    else:
-                        st.session_state.selected_jobs.add(job["id"])
-                    # Reset confirmation state when changing selection
-                    st.session_state.confirm_delete = False
-                    st.rerun()
-
-            with col_content:
-                # Show selection status in expander title
-                # Add application indicator and site to title
-                applied_indicator = "✅ APPLIED" if job.get("application_date") else ""
-                expander_title = f"{selection_emoji} {score_display}/10 {site_emoji} - {job['title']} @ {job['company']} - {job['location']} {applied_indicator}"
-
-                with st.expander(expander_title, expanded=False):
-                    col1, col2, col3 = st.columns([2, 1, 0.3])
-
-                    with col1:
-                        st.write(f"**ID:** {job['id']}")
-                        st.write(
-                            f"**Site:** {site_emoji} {job.get('site', 'Unknown').title()}"
-                        )
-                        st.write(f"**Posted:** {job['date_posted'] or 'Unknown'}")
-                        st.write(
-                            f"**Scraped:** {job['date_scraped'][:10] if job['date_scraped'] else 'Unknown'}"
-                        )
-                        st.write(f"**Type:** {job['job_type'] or 'N/A'}")
-
-                        # URLs
-                        if job["job_url"]:
-                            st.write(f"**URL:** [{job['job_url']}]({job['job_url']})")
-                        if job["job_url_direct"]:
-                            st.write(
-                                f"**Direct:** [{job['job_url_direct']}]({job['job_url_direct']})"
-                            )
-
-                        # Salary info if available
-                        if job.get("min_amount") or job.get("max_amount"):
-                            salary_text = ""
-                            if job.get("min_amount") and job.get("max_amount"):
-                                salary_text = f"{job['min_amount']:,.0f} - {job['max_amount']:,.0f}"
-                            elif job.get("min_amount"):
-                                salary_text = f"From {job['min_amount']:,.0f}"
-                            elif job.get("max_amount"):
-                                salary_text = f"Up to {job['max_amount']:,.0f}"
-
-                            if salary_text:
-                                st.write(
-                                    f"**Salary:** {salary_text} {job.get('currency') or ''} ({job.get('interval') or 'N/A'})"
-                                )
-
-                        st.write("**LLM Reasoning:**")
-                        st.write(job["llm_reasoning"] or "N/A")
-
-                        # Show warning if description is missing
-                        if (
-                            not job.get("description")
-                            or len(job.get("description", "")) < 50
-                        ):
-                            st.warning("⚠️ Description missing or incomplete")
-
-                        with st.expander("📄 Full Description"):
-                            st.markdown(
-                                job["description"] or "No description available"
-                            )
-
-                        # Company info if available
-                        if job.get("company_description"):
-                            with st.expander("🏢 Company Info"):
-                                if job.get("company_logo"):
-                                    st.image(job["company_logo"], width=100)
-                                st.write(job["company_description"])
-                                if job.get("company_revenue"):
-                                    st.write(f"**Revenue:** {job['company_revenue']}")
-                                if job.get("company_num_employees"):
-                                    st.write(
-                                        f"**Employees:** {job['company_num_employees']}"
-                                    )
-
-                    with col2:
-                        st.write("### Application")
-
-                        if job.get("application_date"):
-                            st.success(f"✅ Applied on {job['application_date'][:10]}")
-                            st.write(f"**Resume:** {job.get('resume_version')}")
-                            if job.get("resume_file_path"):
-                                resume_path = Path(job["resume_file_path"])
-                                if resume_path.exists():
-                                    st.write(f"**File:** ✓ {resume_path.name}")
-                                else:
-                                    st.write(
-                                        f"**File:** ⚠️ {resume_path.name} (not found)"
-                                    )
-
-                            # Interview stages
-                            if job.get("stages"):
-                                st.write("**Stages:**")
-                                stages_list = job["stages"].split(",")
-                                for stage in stages_list:
-                                    st.write(f"• {stage}")
-
-                            # Add new stage
-                            with st.form(f"stage_{job['id']}"):
-                                st.write("**Add Interview Stage**")
-                                new_stage = st.selectbox(
-                                    "Stage",
-                                    get_stage_options(),
-                                    format_func=format_stage_option,
-                                    key=f"stage_select_{job['id']}",
-                                )
-                                stage_notes = st.text_area(
-                                    "Notes", key=f"stage_notes_{job['id']}"
-                                )
-                                # Stage date picker
-                                stage_date = st.date_input(
-                                    "Stage Date",
-                                    value=datetime.date.today(),
-                                    key=f"stage_date_{job['id']}",
-                                )
-                                if st.form_submit_button("Add Stage"):
-                                    if new_stage:
-                                        # Convert date to string format for database
-                                        date_str = stage_date.strftime("%Y-%m-%d")
-                                        db.add_interview_stage(
-                                            job["id"], new_stage, stage_notes, date_str
-                                        )
-                                        st.toast("Stage added!")
-                                        st.rerun()
-                        else:
-                            # Mark as applied - with resume file picker
-                            with st.form(f"apply_{job['id']}"):
-                                st.write("**Mark as Applied**")
-
-                                # Get available resumes from folder
-                                available_resumes = get_resume_version_pdf()
-
-                                if available_resumes:
-                                    selected_resume = st.selectbox(
-                                        "Select Resume",
-                                        options=available_resumes,
-                                        key=f"resume_select_{job['id']}",
-                                    )
-
-                                    # Show full path - use RESUME_FINAL_DIR
-                                    resume_full_path = str(
-                                        Path(constants.RESUME_FINAL_DIR)
-                                        / selected_resume
-                                    )
-                                    st.caption(f"📁 Full path: `{resume_full_path}`")
-
-                                    # Extract version from filename (without extension)
-                                    resume_version = Path(selected_resume).stem
-
-                                else:
-                                    st.warning("⚠️ No resumes found in 'Resumes' folder")
-                                    st.info(
-                                        "Please add resume files to the 'Resumes' folder"
-                                    )
-                                    selected_resume = None
-                                    resume_version = "unknown"
-                                    resume_full_path = ""
-
-                                # Optional: Cover letter
-                                cover_letter_path = st.text_input(
-                                    "Cover Letter (optional)", key=f"cover_{job['id']}"
-                                )
-
-                                # Notes
-                                notes = st.text_area(
-                                    "Application Notes", key=f"notes_{job['id']}"
-                                )
-
-                                # Application date picker
-                                application_date = st.date_input(
-                                    "Application Date",
-                                    value=datetime.date.today(),
-                                    key=f"date_{job['id']}",
-                                )
-
-                                # Submit button
-                                submit_disabled = not available_resumes
-                                if st.form_submit_button(
-                                    "Mark Applied", disabled=submit_disabled
-                                ):
-                                    if selected_resume:
-                                        # Convert date to string format for database
-                                        date_str = application_date.strftime("%Y-%m-%d")
-                                        db.mark_applied(
-                                            job["id"],
-                                            resume_version,
-                                            resume_full_path,
-                                            cover_letter_path,
-                                            notes,
-                                            date_str,
-                                        )
-                                        st.toast("Marked as applied!")
-                                        st.rerun()
-
-                    with col3:
-                        st.write("")
-                        st.write("")
-                        if st.button(
-                            "✏️", key=f"edit_{job['id']}", help="Edit this job"
-                        ):
-                            st.session_state.editing_job_id = job["id"]
-                            st.rerun()
-
-                        is_archived = bool(job.get("archived", 0))
-                        archive_label = "📤" if is_archived else "📦"
-                        archive_help = (
-                            "Unarchive this job" if is_archived else "Archive this job"
-                        )
-                        if st.button(
-                            archive_label,
-                            key=f"archive_{job['id']}",
-                            help=archive_help,
-                        ):
-                            if is_archived:
-                                db.unarchive_job(job["id"])
-                                st.toast("Unarchived!")
-                            else:
-                                db.archive_job(job["id"])
-                                st.session_state.selected_jobs.discard(job["id"])
-                                st.toast("Archived!")
-                            st.rerun()
-
-                        if st.button(
-                            "🗑️", key=f"del_{job['id']}", help="Delete this job"
-                        ):
-                            cursor = db.conn.cursor()
-                            # Delete related records first
-                            cursor.execute(
-                                "DELETE FROM applications WHERE job_id = ?",
-                                (job["id"],),
-                            )
-                            cursor.execute(
-                                "DELETE FROM interview_stages WHERE job_id = ?",
-                                (job["id"],),
-                            )
-                            cursor.execute(
-                                "DELETE FROM jobs WHERE id = ?", (job["id"],)
-                            )
-                            db.conn.commit()
-                            st.session_state.selected_jobs.discard(job["id"])
-                            st.toast("Deleted!")
-                            st.rerun()
+        jobs_view = build_jobs_view(
+            tuple(tuple(job.get(field) for field in VIEW_FIELDS) for job in jobs)
+        )
+
+        # One editor widget for the whole page instead of a button per job
+        editor_key = f"jobs_editor_{st.session_state.jobs_editor_version}"
+        st.data_editor(
+            jobs_view[TABLE_COLUMNS].assign(
+                select=[job_id in selected for job_id in job_ids]
+            ),
+            key=editor_key,
+            hide_index=True,
+            width="stretch",
+            column_order=("select", *TABLE_COLUMNS),
+            disabled=("score", "site", "title", "company", "location", "applied"),
+            column_config={
+                "select": st.column_config.CheckboxColumn("Select", width="small"),
+                "score": st.column_config.NumberColumn("Score", format="%d/10"),
+                "site": "Site",
+                "title": "Title",
+                "company": "Company",
+                "location": "Location",
+                "applied": st.column_config.CheckboxColumn("Applied", width="small"),
+            },
+            on_change=apply_selection_edits,
+            args=(editor_key, job_ids),
+        )
+
+        # Same for every unapplied job on the page
+        available_resumes = get_resume_version_pdf()
+        existing_resumes = frozenset(available_resumes)
+
+        for job, display in zip(jobs, jobs_view.itertuples(index=False)):
+            render_job_row(db, job, display, available_resumes, existing_resumes)
 
     else:
         st.info("No jobs found with current filters")
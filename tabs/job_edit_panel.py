@@ -2,6 +2,7 @@
 
 import datetime
 import logging
+import time
 from typing import Any
 
 import streamlit as st
@@ -14,6 +15,193 @@ from modules.interview_stages_loader import (
 
 logger = logging.getLogger(__name__)
 
+STAGE_OPTIONS = tuple(get_stage_options())
+STAGE_INDEX = {stage: i for i, stage in enumerate(STAGE_OPTIONS)}
+STAGE_LABELS = {stage: format_stage_option(stage) for stage in STAGE_OPTIONS}
+
+# Pipeline output shown read-only under the job fields: (label, job field)
+ANALYSIS_SECTIONS = (
+    ("LLM Reasoning", "llm_reasoning"),
+    ("Extracted Skills", "extracted_skills"),
+    ("Matched Skills", "matched_skills"),
+    ("Partial Skills", "partial_skills"),
+    ("Missing Skills", "missing_skills"),
+)
+
+# Seconds the edit panel reuses a job's rows before reading them again
+EDIT_DATA_TTL = 60
+
+
+def parse_iso_date(value: str | None) -> datetime.date | None:
+    """Parse the date part of an ISO date or datetime string.
+
+    Args:
+        value: Stored date such as "2024-01-31" or "2024-01-31 09:00:00".
+
+    Returns:
+        The date, or None if the value is empty or not an ISO date.
+    """
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(value[:10])
+    except (TypeError, ValueError) as e:
+        logger.warning(f"Failed to parse date {value!r}: {e}")
+        return None
+
+
+def changed_fields(updates: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+    """Keep only the updates that differ from the stored row.
+
+    Empty values match NULL columns, since the form shows NULL as an empty
+    text input or an unticked checkbox.
+
+    Args:
+        updates: Field values from the edit form.
+        current: Stored row the form was filled from.
+
+    Returns:
+        The updates whose value changed.
+    """
+    return {
+        field: value
+        for field, value in updates.items()
+        if value != current.get(field)
+        and not (not value and current.get(field) is None)
+    }
+
+
+def load_edit_data(
+    db: JobDatabase, job_id: int
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None, list[dict[str, Any]]]:
+    """Fetch a job with its application and interview stages.
+
+    The rows are kept in the session until refresh_edit_data is called or
+    EDIT_DATA_TTL passes, so they are re-read after a write, not on every
+    keystroke. The cache is per session, so other sessions never see it.
+
+    Args:
+        db: Database instance.
+        job_id: ID of the job.
+
+    Returns:
+        Tuple of (job or None, application or None, interview stages).
+    """
+    cached = st.session_state.get("edit_data")
+    now = time.monotonic()
+    if cached is None or cached[0] != job_id or now - cached[1] >= EDIT_DATA_TTL:
+        cached = (job_id, now, db.get_job_edit_data(job_id))
+        st.session_state.edit_data = cached
+    return cached[2]
+
+
+def refresh_edit_data() -> None:
+    """Make the edit panel re-read its job after a write."""
+    st.session_state.pop("edit_data", None)
+
+
+@st.fragment
+def render_interview_stages(
+    db: JobDatabase, job_id: int, stages: list[dict[str, Any]]
+) -> None:
+    """Render the interview stages of a job with their edit controls.
+
+    Runs as a fragment, so working on a stage doesn't rerun the job form.
+    Saving a stage still reruns the whole app to reload the stages.
+
+    Args:
+        db: Database instance.
+        job_id: ID of the job.
+        stages: Interview stages of the job.
+    """
+    st.subheader("Interview Stages")
+
+    if stages:
+        for idx, stage in enumerate(stages):
+            with st.expander(
+                f"{format_stage_option(stage['stage'])} - {stage['stage_date'][:10] if stage['stage_date'] else 'N/A'}",
+                expanded=False,
+            ):
+                col1, col2 = st.columns([3, 1])
+
+                with col1:
+                    new_stage = st.selectbox(
+                        "Stage Type",
+                        options=STAGE_OPTIONS,
+                        index=STAGE_INDEX.get(stage["stage"], 0),
+                        format_func=STAGE_LABELS.__getitem__,
+                        key=f"edit_stage_type_{stage['id']}",
+                    )
+
+                    new_stage_date = st.date_input(
+                        "Stage Date",
+                        value=parse_iso_date(stage.get("stage_date")),
+                        key=f"edit_stage_date_{stage['id']}",
+                    )
+
+                    new_notes = st.text_area(
+                        "Notes",
+                        value=stage.get("notes") or "",
+                        key=f"edit_stage_notes_{stage['id']}",
+                    )
+
+                    # Update button for this stage
+                    if st.button("💾 Update Stage", key=f"update_stage_{stage['id']}"):
+                        try:
+                            updates = {
+                                "stage": new_stage,
+                                "stage_date": new_stage_date.strftime("%Y-%m-%d"),
+                                "notes": new_notes,
+                            }
+                            db.update_interview_stage(stage["id"], updates)
+                            refresh_edit_data()
+                            st.toast("✓ Stage updated!")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error updating stage: {e}")
+
+                with col2:
+                    st.write("")
+                    st.write("")
+                    if st.button("🗑️ Delete", key=f"delete_stage_{stage['id']}"):
+                        try:
+                            db.delete_interview_stage(stage["id"])
+                            refresh_edit_data()
+                            st.toast("✓ Stage deleted!")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"Error deleting stage: {e}")
+    else:
+        st.info("No interview stages yet")
+
+    # Add new stage
+    st.subheader("Add New Stage")
+    with st.form(f"add_stage_{job_id}"):
+        new_stage = st.selectbox(
+            "Stage Type",
+            options=STAGE_OPTIONS,
+            format_func=STAGE_LABELS.__getitem__,
+            key="new_stage_type",
+        )
+        new_stage_date = st.date_input(
+            "Stage Date", value=datetime.date.today(), key="new_stage_date"
+        )
+        new_stage_notes = st.text_area("Notes", key="new_stage_notes")
+
+        if st.form_submit_button("➕ Add Stage"):
+            try:
+                db.add_interview_stage(
+                    job_id,
+                    new_stage,
+                    new_stage_notes,
+                    new_stage_date.strftime("%Y-%m-%d"),
+                )
+                refresh_edit_data()
+                st.toast("✓ Stage added!")
+                st.rerun()
+            except Exception as e:
+                st.error(f"Error adding stage: {e}")
+
 
 def render_edit_panel(db: JobDatabase, job_id: int, jobs: list[dict[str, Any]]) -> None:
     """Render the edit panel for a job.
@@ -24,7 +212,7 @@ def render_edit_panel(db: JobDatabase, job_id: int, jobs: list[dict[str, Any]])
         jobs: List of all jobs (for the condensed list).
     """
     # Load job data
-    job = db.get_job_by_id(job_id)
+    job, application, stages = load_edit_data(db, job_id)
     if not job:
         st.error("Job not found!")
         if st.button("❌ Close"):
@@ -32,394 +220,289 @@ def render_edit_panel(db: JobDatabase, job_id: int, jobs: list[dict[str, Any]])
             st.rerun()
         return
 
-    application = db.get_application_by_job_id(job_id)
-    stages = db.get_interview_stages_by_job_id(job_id)
-
     st.header(f"✏️ Editing: {job['title']} @ {job['company']}")
 
-    # Create tabs for different sections
-    tab1, tab2, tab3 = st.tabs(["Job Details", "Application", "Interview Stages"])
-
-    # TAB 1: Job Details
-    with tab1:
-        st.subheader("Editable Fields")
-
-        col1, col2 = st.columns(2)
-        with col1:
-            title = st.text_input(
-                "Title", value=job.get("title") or "", key="edit_title"
-            )
-            company = st.text_input(
-                "Company", value=job.get("company") or "", key="edit_company"
-            )
-            location = st.text_input(
-                "Location", value=job.get("location") or "", key="edit_location"
-            )
-            job_type = st.text_input(
-                "Job Type", value=job.get("job_type") or "", key="edit_job_type"
+    # Job and application fields only submit on Save, so typing into them
+    # doesn't rerun the panel
+    with st.form(f"edit_form_{job_id}", border=False):
+        tab1, tab2 = st.tabs(["Job Details", "Application"])
+
+        # TAB 1: Job Details
+        with tab1:
+            st.subheader("Editable Fields")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                title = st.text_input(
+                    "Title", value=job.get("title") or "", key="edit_title"
+                )
+                company = st.text_input(
+                    "Company", value=job.get("company") or "", key="edit_company"
+                )
+                location = st.text_input(
+                    "Location", value=job.get("location") or "", key="edit_location"
+                )
+                job_type = st.text_input(
+                    "Job Type", value=job.get("job_type") or "", key="edit_job_type"
+                )
+                site = st.text_input(
+                    "Site", value=job.get("site") or "", key="edit_site"
+                )
+                job_url = st.text_input(
+                    "Job URL", value=job.get("job_url") or "", key="edit_job_url"
+                )
+                job_url_direct = st.text_input(
+                    "Job URL Direct",
+                    value=job.get("job_url_direct") or "",
+                    key="edit_job_url_direct",
+                )
+
+            with col2:
+                job_level = st.text_input(
+                    "Job Level", value=job.get("job_level") or "", key="edit_job_level"
+                )
+                job_function = st.text_input(
+                    "Job Function",
+                    value=job.get("job_function") or "",
+                    key="edit_job_function",
+                )
+                date_posted = st.date_input(
+                    "Date Posted",
+                    value=parse_iso_date(job.get("date_posted")),
+                    key="edit_date_posted",
+                )
+
+                is_remote = st.checkbox(
+                    "Is Remote", value=bool(job.get("is_remote")), key="edit_is_remote"
+                )
+
+            # Salary information section
+            st.subheader("Salary Information")
+            col1, col2 = st.columns(2)
+            with col1:
+                min_amount = st.number_input(
+                    "Min Amount",
+                    value=float(job.get("min_amount") or 0),
+                    step=1000.0,
+                    min_value=0.0,
+                    key="edit_min_amount",
+                )
+                currency = st.text_input(
+                    "Currency", value=job.get("currency") or "", key="edit_currency"
+                )
+                salary_source = st.text_input(
+                    "Salary Source",
+                    value=job.get("salary_source") or "",
+                    key="edit_salary_source",
+                )
+            with col2:
+                max_amount = st.number_input(
+                    "Max Amount",
+                    value=float(job.get("max_amount") or 0),
+                    step=1000.0,
+                    min_value=0.0,
+                    key="edit_max_amount",
+                )
+                interval = st.text_input(
+                    "Interval", value=job.get("interval") or "", key="edit_interval"
+                )
+
+            # Company fields
+            st.subheader("Company Information")
+            col1, col2 = st.columns(2)
+            with col1:
+                company_industry = st.text_input(
+                    "Company Industry",
+                    value=job.get("company_industry") or "",
+                    key="edit_company_industry",
+                )
+                company_url = st.text_input(
+                    "Company URL",
+                    value=job.get("company_url") or "",
+                    key="edit_company_url",
+                )
+                company_logo = st.text_input(
+                    "Company Logo",
+                    value=job.get("company_logo") or "",
+                    key="edit_company_logo",
+                )
+                company_url_direct = st.text_input(
+                    "Company URL Direct",
+                    value=job.get("company_url_direct") or "",
+                    key="edit_company_url_direct",
+                )
+            with col2:
+                company_addresses = st.text_input(
+                    "Company Addresses",
+                    value=job.get("company_addresses") or "",
+                    key="edit_company_addresses",
+                )
+                company_num_employees = st.text_input(
+                    "Company Num Employees",
+                    value=job.get("company_num_employees") or "",
+                    key="edit_company_num_employees",
+                )
+                company_revenue = st.text_input(
+                    "Company Revenue",
+                    value=job.get("company_revenue") or "",
+                    key="edit_company_revenue",
+                )
+
+            # Text areas
+            description = st.text_area(
+                "Description",
+                value=job.get("description") or "",
+                height=300,
+                key="edit_description",
             )
-            site = st.text_input("Site", value=job.get("site") or "", key="edit_site")
-            job_url = st.text_input(
-                "Job URL", value=job.get("job_url") or "", key="edit_job_url"
-            )
-            job_url_direct = st.text_input(
-                "Job URL Direct",
-                value=job.get("job_url_direct") or "",
-                key="edit_job_url_direct",
+            company_description = st.text_area(
+                "Company Description",
+                value=job.get("company_description") or "",
+                height=300,
+                key="edit_company_description",
             )
 
-        with col2:
-            job_level = st.text_input(
-                "Job Level", value=job.get("job_level") or "", key="edit_job_level"
-            )
-            job_function = st.text_input(
-                "Job Function",
-                value=job.get("job_function") or "",
-                key="edit_job_function",
-            )
-
-            date_posted_value = None
-            if job.get("date_posted"):
-                try:
-                    date_posted_value = datetime.datetime.strptime(
-                        job["date_posted"], "%Y-%m-%d"
-                    ).date()
-                except Exception as e:
-                    logger.warning(f"Failed to parse date_posted: {e}")
-            date_posted = st.date_input(
-                "Date Posted", value=date_posted_value, key="edit_date_posted"
-            )
-
-            is_remote = st.checkbox(
-                "Is Remote", value=bool(job.get("is_remote")), key="edit_is_remote"
-            )
-
-        # Salary information section
-        st.subheader("Salary Information")
+            # Read-only fields
+            st.subheader("Read-Only Fields (System Generated)")
+            col1, col2 = st.columns(2)
+            # One text element per column rather than one per field
+            with col1:
+                st.text(
+                    f"ID: {job['id']}\n"
+                    f"Date Scraped: {job.get('date_scraped', 'N/A')}\n"
+                    f"LLM Score: {job.get('llm_score', 'N/A')}\n"
+                    f"Heuristic Score: {job.get('heuristic_score', 'N/A')}"
+                )
+            with col2:
+                job_hash = job.get("job_hash")
+                st.text(
+                    f"Job Hash: {job_hash[:20] if job_hash else 'N/A'}...\n"
+                    f"Archived: {job.get('archived', 0)}"
+                )
+
+            for label, field in ANALYSIS_SECTIONS:
+                if job.get(field):
+                    with st.expander(label):
+                        st.write(job[field])
+
+        # TAB 2: Application
+        with tab2:
+            if application:
+                st.subheader("Edit Application")
+
+                application_date = st.date_input(
+                    "Application Date",
+                    value=parse_iso_date(application.get("application_date")),
+                    key="edit_app_date",
+                )
+
+                resume_version = st.text_input(
+                    "Resume Version",
+                    value=application.get("resume_version") or "",
+                    key="edit_resume_version",
+                )
+                resume_file_path = st.text_input(
+                    "Resume File Path",
+                    value=application.get("resume_file_path") or "",
+                    key="edit_resume_file_path",
+                )
+                cover_letter_path = st.text_input(
+                    "Cover Letter Path",
+                    value=application.get("cover_letter_path") or "",
+                    key="edit_cover_letter_path",
+                )
+                notes = st.text_area(
+                    "Notes", value=application.get("notes") or "", key="edit_app_notes"
+                )
+            else:
+                st.info("No application data yet")
+
+        # Save and Cancel buttons
+        st.divider()
         col1, col2 = st.columns(2)
         with col1:
-            min_amount = st.number_input(
-                "Min Amount",
-                value=float(job.get("min_amount") or 0),
-                step=1000.0,
-                min_value=0.0,
-                key="edit_min_amount",
-            )
-            currency = st.text_input(
-                "Currency", value=job.get("currency") or "", key="edit_currency"
-            )
-            salary_source = st.text_input(
-                "Salary Source",
-                value=job.get("salary_source") or "",
-                key="edit_salary_source",
+            save_clicked = st.form_submit_button(
+                "💾 Save Changes", type="primary", width="stretch"
             )
         with col2:
-            max_amount = st.number_input(
-                "Max Amount",
-                value=float(job.get("max_amount") or 0),
-                step=1000.0,
-                min_value=0.0,
-                key="edit_max_amount",
-            )
-            interval = st.text_input(
-                "Interval", value=job.get("interval") or "", key="edit_interval"
-            )
-
-        # Company fields
-        st.subheader("Company Information")
-        col1, col2 = st.columns(2)
-        with col1:
-            company_industry = st.text_input(
-                "Company Industry",
-                value=job.get("company_industry") or "",
-                key="edit_company_industry",
-            )
-            company_url = st.text_input(
-                "Company URL",
-                value=job.get("company_url") or "",
-                key="edit_company_url",
-            )
-            company_logo = st.text_input(
-                "Company Logo",
-                value=job.get("company_logo") or "",
-                key="edit_company_logo",
-            )
-            company_url_direct = st.text_input(
-                "Company URL Direct",
-                value=job.get("company_url_direct") or "",
-                key="edit_company_url_direct",
-            )
-        with col2:
-            company_addresses = st.text_input(
-                "Company Addresses",
-                value=job.get("company_addresses") or "",
-                key="edit_company_addresses",
-            )
-            company_num_employees = st.text_input(
-                "Company Num Employees",
-                value=job.get("company_num_employees") or "",
-                key="edit_company_num_employees",
-            )
-            company_revenue = st.text_input(
-                "Company Revenue",
-                value=job.get("company_revenue") or "",
-                key="edit_company_revenue",
-            )
-
-        # Text areas
-        description = st.text_area(
-            "Description",
-            value=job.get("description") or "",
-            height=300,
-            key="edit_description",
-        )
-        company_description = st.text_area(
-            "Company Description",
-            value=job.get("company_description") or "",
-            height=300,
-            key="edit_company_description",
-        )
-
-        # Read-only fields
-        st.subheader("Read-Only Fields (System Generated)")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.text(f"ID: {job['id']}")
-            st.text(f"Date Scraped: {job.get('date_scraped', 'N/A')}")
-            st.text(f"LLM Score: {job.get('llm_score', 'N/A')}")
-            st.text(f"Heuristic Score: {job.get('heuristic_score', 'N/A')}")
-        with col2:
-            st.text(
-                f"Job Hash: {job.get('job_hash', 'N/A')[:20] if job.get('job_hash') else 'N/A'}..."
-            )
-            st.text(f"Archived: {job.get('archived', 0)}")
-
-        if job.get("llm_reasoning"):
-            with st.expander("LLM Reasoning"):
-                st.write(job["llm_reasoning"])
-
-        if job.get("extracted_skills"):
-            with st.expander("Extracted Skills"):
-                st.write(job["extracted_skills"])
-
-        if job.get("matched_skills"):
-            with st.expander("Matched Skills"):
-                st.write(job["matched_skills"])
-        if job.get("partial_skills"):
-            with st.expander("Partial Skills"):
-                st.write(job["partial_skills"])
-
-        if job.get("missing_skills"):
-            with st.expander("Missing Skills"):
-                st.write(job["missing_skills"])
-
-    # TAB 2: Application
-    with tab2:
-        if application:
-            st.subheader("Edit Application")
-
-            # Date input
-            app_date_value = None
-            if application.get("application_date"):
-                try:
-                    app_date_value = datetime.datetime.strptime(
-                        application["application_date"][:10], "%Y-%m-%d"
-                    ).date()
-                except Exception as e:
-                    logger.warning(f"Failed to parse application_date: {e}")
-
-            application_date = st.date_input(
-                "Application Date", value=app_date_value, key="edit_app_date"
-            )
-
-            resume_version = st.text_input(
-                "Resume Version",
-                value=application.get("resume_version") or "",
-                key="edit_resume_version",
-            )
-            resume_file_path = st.text_input(
-                "Resume File Path",
-                value=application.get("resume_file_path") or "",
-                key="edit_resume_file_path",
-            )
-            cover_letter_path = st.text_input(
-                "Cover Letter Path",
-                value=application.get("cover_letter_path") or "",
-                key="edit_cover_letter_path",
-            )
-            notes = st.text_area(
-                "Notes", value=application.get("notes") or "", key="edit_app_notes"
-            )
-        else:
-            st.info("No application data yet")
-
-    # TAB 3: Interview Stages
-    with tab3:
-        st.subheader("Interview Stages")
-
-        if stages:
-            for idx, stage in enumerate(stages):
-                with st.expander(
-                    f"{format_stage_option(stage['stage'])} - {stage['stage_date'][:10] if stage['stage_date'] else 'N/A'}",
-                    expanded=False,
+            cancel_clicked = st.form_submit_button("❌ Cancel", width="stretch")
+
+    if save_clicked:
+        try:
+            # Collect all job updates
+            job_updates = {
+                "title": title,
+                "company": company,
+                "location": location,
+                "job_type": job_type,
+                "site": site,
+                "job_url": job_url,
+                "job_url_direct": job_url_direct,
+                "salary_source": salary_source,
+                "currency": currency,
+                "interval": interval,
+                "min_amount": min_amount if min_amount > 0 else None,
+                "max_amount": max_amount if max_amount > 0 else None,
+                "job_level": job_level,
+                "job_function": job_function,
+                "is_remote": is_remote,
+                "description": description,
+                "company_industry": company_industry,
+                "company_url": company_url,
+                "company_logo": company_logo,
+                "company_url_direct": company_url_direct,
+                "company_addresses": company_addresses,
+                "company_num_employees": company_num_employees,
+                "company_revenue": company_revenue,
+                "company_description": company_description,
+            }
+
+            # Dates are compared as dates, since stored values may carry a time
+            if date_posted != parse_iso_date(job.get("date_posted")):
+                job_updates["date_posted"] = (
+                    date_posted.strftime("%Y-%m-%d") if date_posted else None
+                )
+            job_updates = changed_fields(job_updates, job)
+
+            # Update application if exists
+            app_updates = {}
+            if application:
+                app_updates = {
+                    "resume_version": resume_version,
+                    "resume_file_path": resume_file_path,
+                    "cover_letter_path": cover_letter_path,
+                    "notes": notes,
+                }
+                if application_date != parse_iso_date(
+                    application.get("application_date")
                 ):
-                    col1, col2 = st.columns([3, 1])
-
-                    with col1:
-                        # Get stage options and find current index
-                        stage_options = get_stage_options()
-                        current_stage = stage["stage"]
-                        try:
-                            current_idx = stage_options.index(current_stage)
-                        except ValueError:
-                            current_idx = 0
-
-                        new_stage = st.selectbox(
-                            "Stage Type",
-                            options=stage_options,
-                            index=current_idx,
-                            format_func=format_stage_option,
-                            key=f"edit_stage_type_{stage['id']}",
-                        )
-
-                        # Date input
-                        stage_date_value = None
-                        if stage.get("stage_date"):
-                            try:
-                                stage_date_value = datetime.datetime.strptime(
-                                    stage["stage_date"][:10], "%Y-%m-%d"
-                                ).date()
-                            except Exception as e:
-                                logger.warning(f"Failed to parse stage_date: {e}")
-                        new_stage_date = st.date_input(
-                            "Stage Date",
-                            value=stage_date_value,
-                            key=f"edit_stage_date_{stage['id']}",
-                        )
-
-                        new_notes = st.text_area(
-                            "Notes",
-                            value=stage.get("notes") or "",
-                            key=f"edit_stage_notes_{stage['id']}",
-                        )
-
-                        # Update button for this stage
-                        if st.button(
-                            "💾 Update Stage", key=f"update_stage_{stage['id']}"
-                        ):
-                            try:
-                                updates = {
-                                    "stage": new_stage,
-                                    "stage_date": new_stage_date.strftime("%Y-%m-%d"),
-                                    "notes": new_notes,
-                                }
-                                db.update_interview_stage(stage["id"], updates)
-                                st.toast("✓ Stage updated!")
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"Error updating stage: {e}")
-
-                    with col2:
-                        st.write("")
-                        st.write("")
-                        if st.button("🗑️ Delete", key=f"delete_stage_{stage['id']}"):
-                            try:
-                                db.delete_interview_stage(stage["id"])
-                                st.toast("✓ Stage deleted!")
-                                st.rerun()
-                            except Exception as e:
-                                st.error(f"Error deleting stage: {e}")
-        else:
-            st.info("No interview stages yet")
-
-        # Add new stage
-        st.subheader("Add New Stage")
-        with st.form(f"add_stage_{job_id}"):
-            new_stage = st.selectbox(
-                "Stage Type",
-                options=get_stage_options(),
-                format_func=format_stage_option,
-                key="new_stage_type",
-            )
-            new_stage_date = st.date_input(
-                "Stage Date", value=datetime.date.today(), key="new_stage_date"
-            )
-            new_stage_notes = st.text_area("Notes", key="new_stage_notes")
-
-            if st.form_submit_button("➕ Add Stage"):
-                try:
-                    db.add_interview_stage(
-                        job_id,
-                        new_stage,
-                        new_stage_notes,
-                        new_stage_date.strftime("%Y-%m-%d"),
+                    app_updates["application_date"] = (
+                        application_date.strftime("%Y-%m-%d")
+                        if application_date
+                        else None
                     )
-                    st.toast("✓ Stage added!")
-                    st.rerun()
-                except Exception as e:
-                    st.error(f"Error adding stage: {e}")
-
-    # Save and Cancel buttons
-    st.divider()
-    col1, col2 = st.columns(2)
+                app_updates = changed_fields(app_updates, application)
 
-    with col1:
-        if st.button("💾 Save Changes", type="primary", use_container_width=True):
-            try:
-                # Collect all job updates
-                job_updates = {
-                    "title": title,
-                    "company": company,
-                    "location": location,
-                    "job_type": job_type,
-                    "site": site,
-                    "job_url": job_url,
-                    "job_url_direct": job_url_direct,
-                    "salary_source": salary_source,
-                    "currency": currency,
-                    "interval": interval,
-                    "min_amount": min_amount if min_amount > 0 else None,
-                    "max_amount": max_amount if max_amount > 0 else None,
-                    "job_level": job_level,
-                    "job_function": job_function,
-                    "date_posted": date_posted.strftime("%Y-%m-%d")
-                    if date_posted
-                    else None,
-                    "is_remote": is_remote,
-                    "description": description,
-                    "company_industry": company_industry,
-                    "company_url": company_url,
-                    "company_logo": company_logo,
-                    "company_url_direct": company_url_direct,
-                    "company_addresses": company_addresses,
-                    "company_num_employees": company_num_employees,
-                    "company_revenue": company_revenue,
-                    "company_description": company_description,
-                }
-
-                db.update_job(job_id, job_updates)
-
-                # Update application if exists
-                if application:
-                    app_updates = {
-                        "application_date": application_date.strftime("%Y-%m-%d")
-                        if application_date
-                        else None,
-                        "resume_version": resume_version,
-                        "resume_file_path": resume_file_path,
-                        "cover_letter_path": cover_letter_path,
-                        "notes": notes,
-                    }
+            if job_updates or app_updates:
+                if job_updates:
+                    db.update_job(job_id, job_updates)
+                if app_updates:
                     db.update_application(job_id, app_updates)
-
+                refresh_edit_data()
                 st.toast("✓ Changes saved successfully!")
-                st.session_state.editing_job_id = None
-                st.rerun()
-
-            except Exception as e:
-                st.error(f"Error saving changes: {e}")
-
-    with col2:
-        if st.button("❌ Cancel", use_container_width=True):
+            else:
+                st.toast("No changes to save")
             st.session_state.editing_job_id = None
             st.rerun()
+
+        except Exception as e:
+            st.error(f"Error saving changes: {e}")
+
+    if cancel_clicked:
+        st.session_state.editing_job_id = None
+        st.rerun()
+
+    # Interview stages have their own buttons and form, so they stay outside
+    # the edit form
+    st.divider()
+    render_interview_stages(db, job_id, stages)
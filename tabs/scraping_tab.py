@@ -3,32 +3,79 @@
 import atexit
 import logging
 import os
+import shlex
+import signal
 import subprocess
 import sys
 import tempfile
 import traceback
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import streamlit as st
 
+# A broken constants.py is reported in the tab rather than breaking the
+# whole dashboard
+CONSTANTS_ERROR: str | None = None
+try:
+    from constants import RESUME_FILE, SEARCHES_FILE
+except ImportError as e:
+    CONSTANTS_ERROR = str(e)
+
 # Global process tracker for cleanup
 _active_processes: list[subprocess.Popen[Any]] = []
 
 logger = logging.getLogger(__name__)
 
+# Shown in the searches editor until a searches file is saved
+SEARCHES_TEMPLATE = (
+    "# Format: search_term|location|country[|linkedin_company_ids]\n"
+    "# linkedin_company_ids is optional and comma-separated, e.g. 1441,1035\n"
+    "# Example:\n"
+    "# data scientist|Berlin|Germany|1441,1035\n"
+)
+
+# Lines of the scraping log kept for the live view
+LOG_TAIL_LINES = 1000
+# Most bytes read from the log per refresh; older output is skipped
+LOG_READ_LIMIT = 256 * 1024
+
+
+def stop_process(process: subprocess.Popen[Any], force: bool = False) -> None:
+    """Stop a scraping process together with any children it started.
+
+    On POSIX the scraper is started in its own session, so its whole process
+    group is signalled at once. Elsewhere only the process itself is stopped.
+
+    Args:
+        process: Scraping process to stop.
+        force: Kill instead of asking the process to terminate.
+    """
+    if hasattr(os, "killpg"):
+        try:
+            # The scraper leads its own group, so its pid is the group id
+            os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # The whole group has already exited
+    elif force:
+        process.kill()
+    else:
+        process.terminate()
+
 
 def cleanup_processes() -> None:
     """Kill any active scraping processes on exit."""
     for process in _active_processes:
         if process and process.poll() is None:  # Still running
             try:
-                process.terminate()
+                stop_process(process)
                 process.wait(timeout=5)
             except Exception:
                 try:
-                    process.kill()  # Force kill if terminate didn't work
+                    # Force kill if terminate didn't work
+                    stop_process(process, force=True)
                 except Exception:
                     pass
 
@@ -37,56 +84,182 @@ def cleanup_processes() -> None:
 atexit.register(cleanup_processes)
 
 
-@st.fragment(run_every=2)
-def live_log_viewer() -> None:
-    """Auto-refreshing fragment for live log output - only this section refreshes."""
+def track_process(process: subprocess.Popen[Any]) -> None:
+    """Track a scraping process so it is killed on exit.
+
+    Processes that already exited are dropped first. Their sessions may have
+    closed before noticing, which would otherwise keep them (and their
+    zombie entries) around until the server stops.
+
+    Args:
+        process: Newly started scraping process.
+    """
+    _active_processes[:] = [p for p in _active_processes if p.poll() is None]
+    _active_processes.append(process)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def read_searches_file(path: str, mtime_ns: int) -> str:
+    """Read the searches file.
+
+    Args:
+        path: Path of the searches file.
+        mtime_ns: Modification time of the file. Saving the file changes it,
+            which invalidates the cached contents.
+
+    Returns:
+        Contents of the file.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def clear_finished_process() -> bool:
+    """Forget the scraping process once it has exited.
+
+    Returns:
+        True if the process finished since the last check.
+    """
+    process = st.session_state.scraping_process
+    # poll() is a single non-blocking waitpid, which also reaps the process
+    if process is None or process.poll() is None:
+        return False
+
+    if process in _active_processes:
+        _active_processes.remove(process)
+    st.session_state.scraping_process = None
+    st.session_state.scraping_completed = True
+    return True
+
+
+def reset_log_tail() -> None:
+    """Forget the lines read from the scraping log so far."""
+    st.session_state.scraping_log_offset = 0
+    st.session_state.scraping_log_tail = deque(maxlen=LOG_TAIL_LINES)
+    st.session_state.scraping_log_dropped = False
+    # Set while the offset is inside a line whose start was skipped
+    st.session_state.scraping_log_midline = False
+
+
+def read_new_log_lines(path: str) -> str:
+    """Add the lines written to the scraping log since the last read.
+
+    Only the bytes after scraping_log_offset are read, so a refresh costs
+    what the scraper wrote since the previous one, not the whole log.
+
+    Args:
+        path: Path of the scraping log.
+
+    Returns:
+        The last line if the scraper is still writing it, else "".
+    """
+    state = st.session_state
+    size = os.path.getsize(path)
+    if size < state.scraping_log_offset:
+        # The log was truncated; start over
+        reset_log_tail()
+    if size == state.scraping_log_offset:
+        return ""
+
+    start = max(state.scraping_log_offset, size - LOG_READ_LIMIT)
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(size - start)
+    if start > state.scraping_log_offset:
+        # Skipped ahead, so the first line is cut off
+        state.scraping_log_dropped = True
+        state.scraping_log_midline = True
+    if state.scraping_log_midline:
+        newline = data.find(b"\n")
+        if newline == -1:
+            # Still inside the cut-off line, so all of it is dropped
+            state.scraping_log_offset = size
+            return ""
+        data = data[newline + 1 :]
+        state.scraping_log_midline = False
+
+    # Keep a trailing partial line unread until its newline arrives
+    end = data.rfind(b"\n") + 1
+    if end:
+        lines = data[: end - 1].decode("utf-8", errors="replace").split("\n")
+        tail = state.scraping_log_tail
+        if len(tail) + len(lines) > LOG_TAIL_LINES:
+            state.scraping_log_dropped = True
+        tail.extend(lines)
+    state.scraping_log_offset = size - (len(data) - end)
+    return data[end:].decode("utf-8", errors="replace")
+
+
+def show_log_output() -> None:
+    """Show the scraping status and the tail of the scraping log."""
     if not st.session_state.get("scraping_log_file"):
         st.info("👆 Click 'Start Scraping' to begin. Live output will appear here.")
         return
 
     # Check if process is still running and update state if needed
-    if st.session_state.scraping_process is not None:
-        if st.session_state.scraping_process.poll() is not None:
-            # Process just finished
-            if st.session_state.scraping_process in _active_processes:
-                _active_processes.remove(st.session_state.scraping_process)
-
-            st.session_state.scraping_process = None
-            st.success("✅ Scraping completed!")
-
-    # Show status if running
-    is_running = st.session_state.scraping_process is not None
-    if is_running:
-        elapsed = datetime.now() - st.session_state.scraping_start_time
-        st.info(
-            f"🔄 Scraping in progress... Elapsed: {elapsed.seconds // 60}m {elapsed.seconds % 60}s"
-        )
+    if clear_finished_process():
+        # Rerun the whole tab so its buttons and this viewer go idle
+        st.rerun()
+    if st.session_state.get("scraping_completed"):
+        st.success("✅ Scraping completed!")
 
     # Display log content
-    if (
-        st.session_state.scraping_log_file
-        and Path(st.session_state.scraping_log_file).exists()
-    ):
-        try:
-            with open(st.session_state.scraping_log_file, "r") as f:
-                output = f.read()
-
-            if output:
-                # Show last 1000 lines to prevent UI slowdown with huge logs
-                lines = output.split("\n")
-                if len(lines) > 1000:
-                    display_output = "\n".join(lines[-1000:])
-                    st.caption(f"⚠️ Showing last 1000 lines (total: {len(lines)} lines)")
-                else:
-                    display_output = output
+    try:
+        partial_line = read_new_log_lines(st.session_state.scraping_log_file)
+    except FileNotFoundError:
+        st.info("👆 Click 'Start Scraping' to begin. Live output will appear here.")
+        return
+    except Exception as e:
+        st.error(f"Error reading log: {e}")
+        return
 
-                st.code(display_output, language="log")
-            else:
-                st.info("Waiting for output...")
-        except Exception as e:
-            st.error(f"Error reading log: {e}")
+    tail = st.session_state.scraping_log_tail
+    if tail or partial_line:
+        # Show last LOG_TAIL_LINES lines to prevent UI slowdown with huge logs
+        if st.session_state.scraping_log_dropped:
+            st.caption(f"⚠️ Showing last {LOG_TAIL_LINES} lines")
+        lines = [*tail, partial_line] if partial_line else tail
+        st.code("\n".join(lines), language="log")
     else:
-        st.info("👆 Click 'Start Scraping' to begin. Live output will appear here.")
+        st.info("Waiting for output...")
+
+
+def render_elapsed_timer(elapsed_seconds: int) -> None:
+    """Render an elapsed-time counter that ticks in the browser.
+
+    The counter starts from the server's elapsed time and counts up with the
+    browser's monotonic clock, so a skewed client clock cannot throw it off.
+
+    Args:
+        elapsed_seconds: Seconds since the scraper was started
+    """
+    minutes, seconds = divmod(elapsed_seconds, 60)
+    st.html(
+        f"""<div id="scraping-elapsed" data-elapsed="{elapsed_seconds}">🔄 Scraping in progress... Elapsed: {minutes}m {seconds}s</div>
+<script>
+clearInterval(window.scrapingElapsedTimer);
+(() => {{
+    const el = document.getElementById("scraping-elapsed");
+    if (!el) return;
+    const start = performance.now() - Number(el.dataset.elapsed) * 1000;
+    window.scrapingElapsedTimer = setInterval(() => {{
+        if (!el.isConnected) {{
+            clearInterval(window.scrapingElapsedTimer);
+            return;
+        }}
+        const seconds = Math.floor((performance.now() - start) / 1000);
+        el.innerText = `🔄 Scraping in progress... Elapsed: ${{Math.floor(seconds / 60)}}m ${{seconds % 60}}s`;
+    }}, 1000);
+}})();
+</script>""",
+        unsafe_allow_javascript=True,
+    )
+
+
+@st.fragment(run_every=2)
+def live_log_viewer() -> None:
+    """Auto-refreshing fragment for live log output - only this section refreshes."""
+    show_log_output()
 
 
 def render_scraping_tab() -> None:
@@ -94,22 +267,11 @@ def render_scraping_tab() -> None:
     try:
         st.title("🔍 Job Scraping")
 
-        # Import constants from parent directory
-        try:
-            parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            if parent_dir not in sys.path:
-                sys.path.insert(0, parent_dir)
-
-            import constants
-
-            SEARCHES_FILE = constants.SEARCHES_FILE
-            RESUME_FILE = constants.RESUME_FILE
-        except (ImportError, AttributeError) as e:
-            st.error(f"❌ Configuration error: {e}")
+        if CONSTANTS_ERROR:
+            st.error(f"❌ Configuration error: {CONSTANTS_ERROR}")
             st.info(
                 "Please ensure constants.py has SEARCHES_FILE and RESUME_FILE defined"
             )
-            st.code(traceback.format_exc())
             return
 
         # Initialize session state
@@ -119,6 +281,8 @@ def render_scraping_tab() -> None:
             st.session_state.scraping_log_file = None
         if "scraping_start_time" not in st.session_state:
             st.session_state.scraping_start_time = None
+        if "scraping_log_tail" not in st.session_state:
+            reset_log_tail()
 
         # ==================== CONFIGURATION SECTION ====================
         st.header("⚙️ Configuration")
@@ -131,16 +295,13 @@ def render_scraping_tab() -> None:
             st.subheader("📝 Search Terms")
 
             searches_file_path = Path(SEARCHES_FILE)
-            if searches_file_path.exists():
-                with open(searches_file_path, "r", encoding="utf-8") as f:
-                    current_searches = f.read()
-            else:
-                current_searches = (
-                    "# Format: search_term|location|country[|linkedin_company_ids]\n"
-                    "# linkedin_company_ids is optional and comma-separated, e.g. 1441,1035\n"
-                    "# Example:\n"
-                    "# data scientist|Berlin|Germany|1441,1035\n"
+            try:
+                # Only re-read from disk when the file changed
+                current_searches = read_searches_file(
+                    SEARCHES_FILE, searches_file_path.stat().st_mtime_ns
                 )
+            except FileNotFoundError:
+                current_searches = SEARCHES_TEMPLATE
 
             searches_text = st.text_area(
                 "Edit search terms",
@@ -171,30 +332,30 @@ def render_scraping_tab() -> None:
             if st.session_state.get("show_preview", False):
                 st.divider()
                 st.caption("**Parsed Searches:**")
-                lines = searches_text.strip().split("\n")
                 valid_searches = []
-                for line in lines:
+                for line in searches_text.splitlines():
                     line = line.strip()
-                    if line and not line.startswith("#"):
-                        parts = line.split("|")
-                        if len(parts) >= 1:
-                            search_term = parts[0].strip()
-                            location = parts[1].strip() if len(parts) > 1 else "N/A"
-                            country = parts[2].strip() if len(parts) > 2 else "Germany"
-                            company_ids = parts[3].strip() if len(parts) > 3 else ""
-
-                            if company_ids:
-                                valid_searches.append(
-                                    f"• {search_term} in {location}, {country} [LinkedIn IDs: {company_ids}]"
-                                )
-                            else:
-                                valid_searches.append(
-                                    f"• {search_term} in {location}, {country}"
-                                )
+                    if not line or line.startswith("#"):
+                        continue
+
+                    parts = [part.strip() for part in line.split("|")]
+                    search_term = parts[0]
+                    location = parts[1] if len(parts) > 1 else "N/A"
+                    country = parts[2] if len(parts) > 2 else "Germany"
+                    company_ids = parts[3] if len(parts) > 3 else ""
+
+                    if company_ids:
+                        valid_searches.append(
+                            f"• {search_term} in {location}, {country} [LinkedIn IDs: {company_ids}]"
+                        )
+                    else:
+                        valid_searches.append(
+                            f"• {search_term} in {location}, {country}"
+                        )
 
                 if valid_searches:
-                    for search in valid_searches:
-                        st.caption(search)
+                    # One element for the whole list; markdown line breaks
+                    st.caption("  \n".join(valid_searches))
                     st.info(f"Total: {len(valid_searches)} searches")
                 else:
                     st.warning("No valid searches found")
@@ -266,18 +427,9 @@ def render_scraping_tab() -> None:
         st.header("▶️ Run Scraping")
 
         # Check if scraping is running
+        clear_finished_process()
         is_running = st.session_state.scraping_process is not None
 
-        if is_running:
-            # Check if process is still alive
-            if st.session_state.scraping_process.poll() is not None:
-                # Process finished - remove from tracker
-                if st.session_state.scraping_process in _active_processes:
-                    _active_processes.remove(st.session_state.scraping_process)
-
-                is_running = False
-                st.session_state.scraping_process = None
-
         # Build command
         cmd = [
             sys.executable,
@@ -311,8 +463,13 @@ def render_scraping_tab() -> None:
             if proxies_list:
                 cmd.extend(["--proxies", *proxies_list])
 
-        with st.expander("📋 Command Preview"):
-            st.code(" ".join(cmd), language="bash")
+        # Only render the command while the preview is open
+        with st.expander(
+            "📋 Command Preview", key="command_preview", on_change="rerun"
+        ) as command_preview:
+            if command_preview.open:
+                # Quoted so paths or proxies with spaces copy-paste correctly
+                st.code(shlex.join(cmd), language="bash")
 
         # Control buttons
         col_start, col_stop = st.columns(2)
@@ -330,27 +487,35 @@ def render_scraping_tab() -> None:
                     st.error("❌ Please select at least one job site")
                 else:
                     # Create temporary log file
-                    log_file = tempfile.NamedTemporaryFile(
-                        mode="w+", delete=False, suffix=".log"
+                    log_fd, st.session_state.scraping_log_file = tempfile.mkstemp(
+                        suffix=".log"
                     )
-                    st.session_state.scraping_log_file = log_file.name
-                    log_file.close()
+                    reset_log_tail()
+                    st.session_state.scraping_completed = False
 
-                    # Start process with output redirected to file
-                    with open(st.session_state.scraping_log_file, "w") as f:
+                    # Start process with output redirected to file. The
+                    # child writes straight to the descriptor mkstemp opened
+                    try:
+                        # Text mode and line buffering only apply to pipes;
+                        # unbuffered output keeps the live log current
                         process = subprocess.Popen(
                             cmd,
-                            stdout=f,
+                            stdout=log_fd,
                             stderr=subprocess.STDOUT,
-                            text=True,
-                            bufsize=1,
+                            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+                            # Own process group, so stopping also reaches
+                            # anything the scraper spawns
+                            start_new_session=True,
                         )
+                    finally:
+                        # The child has its own copy
+                        os.close(log_fd)
 
                     st.session_state.scraping_process = process
                     st.session_state.scraping_start_time = datetime.now()
 
                     # Track process globally for cleanup
-                    _active_processes.append(process)
+                    track_process(process)
 
                     st.rerun()
 
@@ -362,7 +527,7 @@ def render_scraping_tab() -> None:
                 type="secondary",
             ):
                 if st.session_state.scraping_process:
-                    st.session_state.scraping_process.terminate()
+                    stop_process(st.session_state.scraping_process)
 
                     # Remove from global tracker
                     if st.session_state.scraping_process in _active_processes:
@@ -378,28 +543,32 @@ def render_scraping_tab() -> None:
         output_container = st.container(height=500)
 
         with output_container:
-            # This fragment auto-refreshes every 2 seconds without blocking the rest of the UI
-            live_log_viewer()
+            if st.session_state.scraping_process is not None:
+                # Rendered once per full run; the browser keeps it ticking
+                elapsed = datetime.now() - st.session_state.scraping_start_time
+                render_elapsed_timer(int(elapsed.total_seconds()))
+                # This fragment auto-refreshes every 2 seconds without blocking the rest of the UI
+                live_log_viewer()
+            else:
+                # Nothing is writing to the log, so there's nothing to poll for
+                show_log_output()
 
         # Download log button
-        if (
-            st.session_state.scraping_log_file
-            and Path(st.session_state.scraping_log_file).exists()
-        ):
-            try:
-                with open(st.session_state.scraping_log_file, "r") as f:
-                    log_content = f.read()
-
-                if log_content:
-                    st.download_button(
-                        "💾 Download Full Log",
-                        data=log_content,
-                        file_name=f"scraping_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-                        mime="text/plain",
-                        use_container_width=True,
-                    )
-            except Exception:
-                pass
+        log_path = st.session_state.scraping_log_file
+        try:
+            log_size = os.path.getsize(log_path) if log_path else 0
+        except OSError:
+            log_size = 0
+        if log_size:
+            # Passing the method defers reading the log until the button is
+            # clicked, instead of on every rerun
+            st.download_button(
+                "💾 Download Full Log",
+                data=Path(log_path).read_bytes,
+                file_name=f"scraping_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                mime="text/plain",
+                use_container_width=True,
+            )
 
     except Exception as e:
         st.error("❌ Fatal error in scraping tab:")